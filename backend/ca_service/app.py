@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from sqlalchemy.orm import Session
 
 from crypto_utils import (
     load_or_create_root_ca, 
-    issue_plugin_cert, 
+    check_openssl_acceleration,
+    init_issuer_worker,
+    issue_plugin_cert_in_worker, 
     verify_certificate,
 )
 from database import (
@@ -29,15 +35,34 @@ app = FastAPI(title="CA Service (Internal PKI)", version="2.0")
 def startup_event():
     init_db()
     clog.log_startup()
+    # Fails startup if OPENSSL_ia32cap masks off AES-NI/SHA-NI the CPU provides
+    clog.log_openssl_info(check_openssl_acceleration())
 
+
+@app.on_event("shutdown")
+def shutdown_event():
+    _ISSUER_POOL.shutdown(wait=False, cancel_futures=True)
+
+# Created before the pool so worker processes only ever load the existing root CA
 root_ca = load_or_create_root_ca(KEYS_DIR)
 
+# Certificate signing is CPU-bound; a process pool lets concurrent issuance use all cores
+_ISSUER_POOL = ProcessPoolExecutor(
+    max_workers=os.cpu_count(),
+    initializer=init_issuer_worker,
+    initargs=(root_ca.key_der, root_ca.cert_der),
+)
+
 
 class IssueCertRequest(BaseModel):
     plugin_id: str = Field(..., min_length=3, max_length=100)
     ttl_hours: int = Field(3, ge=1, le=168)
 
 
+class IssueCertsRequest(BaseModel):
+    items: List[IssueCertRequest] = Field(..., min_length=1, max_length=100)
+
+
 class IssueCertResponse(BaseModel):
     plugin_private_key_pem: str
     certificate_pem: str
@@ -82,52 +107,78 @@ def get_root_ca():
     return {"root_ca_pem": root_ca.cert_pem}
 
 
-@app.post("/issue-cert", response_model=IssueCertResponse)
-def issue_cert(req: IssueCertRequest, request: Request, db: Session = Depends(get_db)):
-    client_ip = request.client.host if request.client else "unknown"
+def _record_issued_cert(db: Session, req: IssueCertRequest, issued: tuple, client_ip: str) -> IssueCertResponse:
+    """Store an issued certificate, write its audit entry and build the response"""
+    plugin_key_pem, plugin_cert_pem, expires_at, serial_number = issued
     
-    clog.log_cert_request(req.plugin_id, req.ttl_hours, client_ip)
+    # Store certificate in database
+    cert_record = IssuedCertificate(
+        serial_number=serial_number,
+        plugin_id=req.plugin_id,
+        status="active",
+        expires_at=datetime.fromisoformat(expires_at.replace("+00:00", "")),
+        cert_pem=plugin_cert_pem
+    )
+    db.add(cert_record)
+    db.commit()
     
-    try:
-        plugin_key_pem, plugin_cert_pem, expires_at, serial_number = issue_plugin_cert(
-            root_key_pem=root_ca.key_pem,
-            root_cert_pem=root_ca.cert_pem,
-            plugin_id=req.plugin_id,
-            ttl_hours=req.ttl_hours,
-        )
-        
-        # Store certificate in database
-        cert_record = IssuedCertificate(
-            serial_number=serial_number,
-            plugin_id=req.plugin_id,
-            status="active",
-            expires_at=datetime.fromisoformat(expires_at.replace("+00:00", "")),
-            cert_pem=plugin_cert_pem
-        )
-        db.add(cert_record)
-        db.commit()
-        
-        # Log audit entry
+    # Log audit entry
+    _log_audit(
+        db=db,
+        operation="ISSUE",
+        plugin_id=req.plugin_id,
+        serial_number=serial_number,
+        success=True,
+        details=f"Certificate issued with TTL {req.ttl_hours} hours",
+        ip_address=client_ip
+    )
+    
+    clog.log_cert_issued(serial_number, expires_at)
+    
+    return IssueCertResponse(
+        plugin_private_key_pem=plugin_key_pem,
+        certificate_pem=plugin_cert_pem,
+        expires_at=expires_at,
+        serial_number=serial_number,
+    )
+
+
+def _record_issued_certs(db: Session, issued_items: list, client_ip: str) -> List[IssueCertResponse]:
+    """Store a batch of issued certificates (one threadpool hop for the whole batch)"""
+    return [_record_issued_cert(db, item, issued, client_ip) for item, issued in issued_items]
+
+
+def _log_issue_failures(db: Session, errors: list, client_ip: str) -> None:
+    """Write a failed ISSUE audit entry for each (request item, exception) pair"""
+    for item, e in errors:
         _log_audit(
             db=db,
             operation="ISSUE",
-            plugin_id=req.plugin_id,
-            serial_number=serial_number,
-            success=True,
-            details=f"Certificate issued with TTL {req.ttl_hours} hours",
+            plugin_id=item.plugin_id,
+            success=False,
+            details=str(e),
             ip_address=client_ip
         )
-        
-        clog.log_cert_issued(serial_number, expires_at)
-        
-        return IssueCertResponse(
-            plugin_private_key_pem=plugin_key_pem,
-            certificate_pem=plugin_cert_pem,
-            expires_at=expires_at,
-            serial_number=serial_number,
+
+
+@app.post("/issue-cert", response_model=IssueCertResponse)
+async def issue_cert(req: IssueCertRequest, request: Request, db: Session = Depends(get_db)):
+    client_ip = request.client.host if request.client else "unknown"
+    
+    clog.log_cert_request(req.plugin_id, req.ttl_hours, client_ip)
+    
+    try:
+        issued = await asyncio.get_running_loop().run_in_executor(
+            _ISSUER_POOL,
+            issue_plugin_cert_in_worker,
+            req.plugin_id,
+            req.ttl_hours,
         )
+        # SQLAlchemy I/O is blocking: keep it off the event loop
+        return await run_in_threadpool(_record_issued_cert, db, req, issued, client_ip)
     except Exception as e:
-        _log_audit(
+        await run_in_threadpool(
+            _log_audit,
             db=db,
             operation="ISSUE",
             plugin_id=req.plugin_id,
@@ -138,6 +189,36 @@ def issue_cert(req: IssueCertRequest, request: Request, db: Session = Depends(ge
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/issue-certs", response_model=List[IssueCertResponse])
+async def issue_certs(req: IssueCertsRequest, request: Request, db: Session = Depends(get_db)):
+    """
+    Issue certificates for several plugins in one call.
+    
+    Signing runs in parallel on the issuer pool. The batch is all-or-nothing:
+    if any certificate fails, none are stored and a 500 is returned.
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    
+    for item in req.items:
+        clog.log_cert_request(item.plugin_id, item.ttl_hours, client_ip)
+    
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *[
+            loop.run_in_executor(_ISSUER_POOL, issue_plugin_cert_in_worker, item.plugin_id, item.ttl_hours)
+            for item in req.items
+        ],
+        return_exceptions=True,
+    )
+    
+    errors = [(item, r) for item, r in zip(req.items, results) if isinstance(r, BaseException)]
+    if errors:
+        await run_in_threadpool(_log_issue_failures, db, errors, client_ip)
+        raise HTTPException(status_code=500, detail=str(errors[0][1]))
+    
+    return await run_in_threadpool(_record_issued_certs, db, list(zip(req.items, results)), client_ip)
+
+
 @app.post("/verify-cert", response_model=VerifyCertResponse, deprecated=True)
 def verify_cert(req: VerifyCertRequest, request: Request, db: Session = Depends(get_db)):
     """
@@ -159,7 +240,7 @@ def verify_cert(req: VerifyCertRequest, request: Request, db: Session = Depends(
     try:
         is_valid, result = verify_certificate(
             cert_pem=req.certificate_pem,
-            root_ca_cert_pem=root_ca.cert_pem,
+            root_ca_cert=root_ca.root_cert,
             expected_plugin_id=req.plugin_id
         )
         
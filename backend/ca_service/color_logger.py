@@ -87,6 +87,19 @@ def log_startup():
     print()
 
 
+def log_openssl_info(info):
+    """Log the linked OpenSSL build and hardware crypto acceleration"""
+    def state(value):
+        if value is None:
+            return "unknown"
+        return "available" if value else "not supported by CPU"
+    
+    print(f"[CA SERVICE] OpenSSL: {info['openssl_version']}")
+    print(f"[CA SERVICE] AES-NI: {state(info['aes_ni'])}")
+    print(f"[CA SERVICE] SHA-NI: {state(info['sha_ni'])}")
+    print()
+
+
 def log_cert_request(plugin_id, ttl_hours, client_ip):
     """Log certificate issuance request"""
     print()
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Tuple, Dict, Any, Optional
 
 from cryptography import x509
+from cryptography.hazmat.backends.openssl import backend as openssl_backend
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
 from cryptography.x509.oid import NameOID, ExtendedKeyUsageOID
 
 UTC = timezone.utc
@@ -16,8 +19,27 @@ UTC = timezone.utc
 
 @dataclass
 class RootCA:
-    key_pem: str
+    # DER (PKCS8 for the key) is the internal form; PEM is only kept for the /root-ca response
+    key_der: bytes
+    cert_der: bytes
     cert_pem: str
+    # Parsed once at load time; the root CA is immutable for the service lifetime
+    root_key: PrivateKeyTypes
+    root_cert: x509.Certificate
+
+
+def _build_root_ca(root_key: PrivateKeyTypes, root_cert: x509.Certificate) -> RootCA:
+    return RootCA(
+        key_der=root_key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        ),
+        cert_der=root_cert.public_bytes(serialization.Encoding.DER),
+        cert_pem=root_cert.public_bytes(serialization.Encoding.PEM).decode("utf-8"),
+        root_key=root_key,
+        root_cert=root_cert,
+    )
 
 
 def _write_text(path: Path, text: str) -> None:
@@ -34,7 +56,10 @@ def load_or_create_root_ca(keys_dir: Path) -> RootCA:
     cert_path = keys_dir / "root_ca_cert.pem"
 
     if key_path.exists() and cert_path.exists():
-        return RootCA(key_pem=_read_text(key_path), cert_pem=_read_text(cert_path))
+        return _build_root_ca(
+            serialization.load_pem_private_key(_read_text(key_path).encode("utf-8"), password=None),
+            x509.load_pem_x509_certificate(_read_text(cert_path).encode("utf-8")),
+        )
 
     root_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
 
@@ -75,7 +100,7 @@ def load_or_create_root_ca(keys_dir: Path) -> RootCA:
 
     key_pem = root_key.private_bytes(
         encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption(),
     ).decode("utf-8")
 
@@ -84,19 +109,18 @@ def load_or_create_root_ca(keys_dir: Path) -> RootCA:
     _write_text(key_path, key_pem)
     _write_text(cert_path, cert_pem)
 
-    return RootCA(key_pem=key_pem, cert_pem=cert_pem)
+    return _build_root_ca(root_key, root_cert)
 
 
 def issue_plugin_cert(
-    root_key_pem: str,
-    root_cert_pem: str,
+    root_key: PrivateKeyTypes,
+    root_cert: x509.Certificate,
     plugin_id: str,
     ttl_hours: int = 3,
 ) -> Tuple[str, str, str, str]:
-    root_key = serialization.load_pem_private_key(root_key_pem.encode("utf-8"), password=None)
-    root_cert = x509.load_pem_x509_certificate(root_cert_pem.encode("utf-8"))
-
-    plugin_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    # Ed25519 keygen is microseconds (no prime search), so no pre-generated pool is needed.
+    # The root CA stays RSA: the Secure Gateway verifies plugin certs with PKCS1v15.
+    plugin_key = ed25519.Ed25519PrivateKey.generate()
 
     subject = x509.Name(
         [
@@ -125,7 +149,7 @@ def issue_plugin_cert(
             x509.KeyUsage(
                 digital_signature=True,
                 content_commitment=False,
-                key_encipherment=True,
+                key_encipherment=False,
                 data_encipherment=False,
                 key_agreement=False,
                 key_cert_sign=False,
@@ -140,7 +164,7 @@ def issue_plugin_cert(
 
     plugin_key_pem = plugin_key.private_bytes(
         encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption(),
     ).decode("utf-8")
 
@@ -149,9 +173,94 @@ def issue_plugin_cert(
     return plugin_key_pem, plugin_cert_pem, expires.isoformat(), str(serial)
 
 
+# Root CA as loaded inside an issuer worker process. Key objects cannot be pickled,
+# so each worker parses the root CA's DER bytes once via its pool initializer.
+_WORKER_ROOT_KEY: Optional[PrivateKeyTypes] = None
+_WORKER_ROOT_CERT: Optional[x509.Certificate] = None
+
+
+def init_issuer_worker(root_key_der: bytes, root_cert_der: bytes) -> None:
+    global _WORKER_ROOT_KEY, _WORKER_ROOT_CERT
+    _WORKER_ROOT_KEY = serialization.load_der_private_key(root_key_der, password=None)
+    _WORKER_ROOT_CERT = x509.load_der_x509_certificate(root_cert_der)
+
+
+def issue_plugin_cert_in_worker(plugin_id: str, ttl_hours: int = 3) -> Tuple[str, str, str, str]:
+    """Process-pool entry point for issue_plugin_cert using the worker's root CA."""
+    if _WORKER_ROOT_KEY is None or _WORKER_ROOT_CERT is None:
+        raise RuntimeError("Issuer worker not initialized")
+    return issue_plugin_cert(
+        root_key=_WORKER_ROOT_KEY,
+        root_cert=_WORKER_ROOT_CERT,
+        plugin_id=plugin_id,
+        ttl_hours=ttl_hours,
+    )
+
+
+# Bits in OPENSSL_ia32cap for the features the CA depends on: AES-NI is CPUID.1:ECX[25]
+# (bit 57 of the first word), SHA-NI is CPUID.7:EBX[29] (bit 29 of the second word).
+_IA32CAP_AESNI = (0, 1 << 57)
+_IA32CAP_SHANI = (1, 1 << 29)
+
+
+def _cpu_flags() -> Optional[set]:
+    """CPU feature flags from /proc/cpuinfo, or None where that is not available."""
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        return None
+    return set()
+
+
+def _ia32cap_masked(word: int, bit: int) -> bool:
+    """True if the OPENSSL_ia32cap environment override disables the given capability bit."""
+    raw = os.environ.get("OPENSSL_ia32cap", "").strip()
+    if not raw:
+        return False
+    parts = raw.split(":")
+    if word >= len(parts) or not parts[word].strip():
+        return False
+    value = parts[word].strip()
+    try:
+        if value.startswith("~"):
+            return bool(int(value[1:], 0) & bit)
+        return not (int(value, 0) & bit)
+    except ValueError:
+        return False
+
+
+def check_openssl_acceleration() -> Dict[str, Any]:
+    """
+    Report the OpenSSL build linked by cryptography and the state of AES-NI / SHA-NI.
+    Raises RuntimeError if the CPU supports an extension but OPENSSL_ia32cap disables it,
+    since every certificate signature would then fall back to the slow generic code.
+    """
+    flags = _cpu_flags()
+    info: Dict[str, Any] = {
+        "openssl_version": openssl_backend.openssl_version_text(),
+        "aes_ni": None if flags is None else "aes" in flags,
+        "sha_ni": None if flags is None else "sha_ni" in flags,
+    }
+
+    disabled = [
+        name
+        for name, cap in (("aes_ni", _IA32CAP_AESNI), ("sha_ni", _IA32CAP_SHANI))
+        if info[name] and _ia32cap_masked(*cap)
+    ]
+    if disabled:
+        raise RuntimeError(
+            f"OPENSSL_ia32cap disables {', '.join(disabled)} supported by this CPU; "
+            "unset it or stop masking these bits"
+        )
+    return info
+
+
 def verify_certificate(
     cert_pem: str,
-    root_ca_cert_pem: str,
+    root_ca_cert: x509.Certificate,
     expected_plugin_id: Optional[str] = None
 ) -> Tuple[bool, Any]:
     """
@@ -160,7 +269,6 @@ def verify_certificate(
     """
     try:
         cert = x509.load_pem_x509_certificate(cert_pem.encode("utf-8"))
-        root_ca_cert = x509.load_pem_x509_certificate(root_ca_cert_pem.encode("utf-8"))
         
         # Extract plugin_id from CN
         cn_attr = cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
@@ -2,16 +2,27 @@
 from pathlib import Path
 from datetime import datetime
 import os
+import asyncio
+import functools
 import json
 import shutil
 import re, subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Optional, Dict
 
+import orjson
+import psutil
 from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Query, Body
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from plugin_router import router as plugins_router
+from plugin_manager import docker_client
+from docker.errors import NotFound
 from file_router import router as file_router
 
 
@@ -20,6 +31,8 @@ from process_registry import (
     STORAGE_DIR, PROJECT_DIR, JAR_FILE, META_FILE,
     write_pid, read_pid, clear_pid,
     is_running, find_runnable_jar, reset_project_dir, status_dict, write_meta,
+    project_present, node_project_root, read_package_json,
+    node_candidates as find_node_candidates,
     # Docker container registry helpers (must exist in process_registry.py)
     read_containers, add_container, remove_container, clear_containers
 )
@@ -42,6 +55,10 @@ PLUGINS_DIR = PROJECT_DIR / "ai_plugins"
 PLUGINS_DIR.mkdir(parents=True, exist_ok=True)
 app.mount("/plugins", StaticFiles(directory=str(PLUGINS_DIR), html=False), name="plugins")
 
+# Resolved once; _safe_join expects an already-resolved base
+PROJECT_DIR_RESOLVED = PROJECT_DIR.resolve()
+PLUGINS_DIR_RESOLVED = PLUGINS_DIR.resolve()
+
 # ==============================================================================
 # Models
 # ==============================================================================
@@ -82,14 +99,15 @@ class DockerStartManyReq(BaseModel):
 # ==============================================================================
 # Utilities
 # ==============================================================================
-def _safe_join(base: Path, rel: str) -> Path:
-    p = (base / rel).resolve()
-    if not str(p).startswith(str(base.resolve())):
+def _safe_join(base_resolved: Path, rel: str) -> Path:
+    p = (base_resolved / rel).resolve()
+    if not p.is_relative_to(base_resolved):
         raise HTTPException(400, detail="Invalid path")
     return p
 
 def _project_present() -> bool:
-    return PROJECT_DIR.exists() and any(PROJECT_DIR.rglob("*"))
+    # Only needs one directory entry, so don't walk the whole uploaded tree
+    return project_present()
 
 def _npm_exe() -> str:
     return "npm.cmd" if os.name == "nt" else "npm"
@@ -97,13 +115,30 @@ def _npm_exe() -> str:
 def _node_exe() -> str:
     return "node.exe" if os.name == "nt" else "node"
 
+@functools.lru_cache(maxsize=1)
 def _docker_exe() -> str:
     return "docker.exe" if os.name == "nt" else "docker"
 
+_WHICH_CACHE: Dict[str, str] = {}
+
 def _which(cmd: str) -> Optional[str]:
-    return shutil.which(cmd)
+    # npm/node/docker don't move while the server runs; only hits are cached so a
+    # tool installed after startup is still picked up
+    path = _WHICH_CACHE.get(cmd)
+    if path is None:
+        path = shutil.which(cmd)
+        if path:
+            _WHICH_CACHE[cmd] = path
+    return path
+
+# `docker info` costs a process spawn + daemon round-trip; trust a success for a short while
+DOCKER_OK_TTL = 30.0
+_DOCKER_OK_UNTIL = 0.0
 
 def _ensure_docker():
+    global _DOCKER_OK_UNTIL
+    if time.monotonic() < _DOCKER_OK_UNTIL:
+        return
     if not _which(_docker_exe()):
         raise HTTPException(500, detail="`docker` not found on PATH. Install Docker Desktop/Engine and restart the terminal.")
     # quick ping to engine (won’t spam logs)
@@ -111,29 +146,46 @@ def _ensure_docker():
         subprocess.run([_docker_exe(), "info"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
     except Exception:
         raise HTTPException(500, detail="Docker daemon is not running.")
+    _DOCKER_OK_UNTIL = time.monotonic() + DOCKER_OK_TTL
 
 # ==============================================================================
 # Build log helpers (optional but handy)
 # ==============================================================================
 BUILD_LOG = STORAGE_DIR / "build.log"
 
+# One long-lived unbuffered binary append handle: no open/close or codec setup per
+# line, and each message is a single write() under the lock so concurrent docker
+# starts can't tear lines. Readers always see everything written so far.
+_LOG_LOCK = threading.Lock()
+_LOG_FH = None
+
+def _log_fh():
+    global _LOG_FH
+    if _LOG_FH is None:
+        BUILD_LOG.parent.mkdir(parents=True, exist_ok=True)
+        _LOG_FH = BUILD_LOG.open("ab", buffering=0)
+    return _LOG_FH
+
+def _log_line(msg: bytes):
+    with _LOG_LOCK:
+        _log_fh().write(msg + b"\n")
+
 def _append_log(msg: str):
-    BUILD_LOG.parent.mkdir(parents=True, exist_ok=True)
-    with BUILD_LOG.open("a", encoding="utf-8") as f:
-        f.write(f"[{datetime.now().isoformat(timespec='seconds')}] {msg}\n")
+    _log_line(f"[{datetime.now().isoformat(timespec='seconds')}] {msg}".encode("utf-8"))
 
 def _run(cmd: List[str], cwd: Path, timeout: int = 900) -> int:
     _append_log(f"RUN: {' '.join(cmd)} (cwd={cwd})")
     try:
-        proc = subprocess.run(
-            cmd, cwd=str(cwd),
-            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-            timeout=timeout, check=False,
-        )
-        with BUILD_LOG.open("a", encoding="utf-8") as f:
-            f.write(proc.stdout.decode(errors="ignore"))
-        _append_log(f"EXIT: {proc.returncode}")
-        return proc.returncode
+        # The child appends straight to build.log so long npm runs are never held in memory
+        proc = subprocess.Popen(cmd, cwd=str(cwd), stdout=_log_fh(), stderr=subprocess.STDOUT)
+        try:
+            rc = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        _append_log(f"EXIT: {rc}")
+        return rc
     except subprocess.TimeoutExpired:
         _append_log("TIMEOUT")
         return 124
@@ -145,28 +197,43 @@ def _run(cmd: List[str], cwd: Path, timeout: int = 900) -> int:
 def core_build_log():
     if not BUILD_LOG.exists():
         return {"log": ""}
-    txt = BUILD_LOG.read_text(encoding="utf-8")
-    return {"log": txt[-100_000:]}  # last 100KB
+    # Only read the tail; the log grows without bound across builds
+    size = BUILD_LOG.stat().st_size
+    with BUILD_LOG.open("rb") as f:
+        f.seek(max(0, size - 100_000))
+        return {"log": f.read().decode("utf-8", errors="ignore")}  # last 100KB
 
 # ==============================================================================
 # Upload (webkitdirectory)
 # ==============================================================================
+UPLOAD_CONCURRENCY = 16
+
+def _copy_upload(uf: UploadFile, dest: Path) -> None:
+    # UploadFile.file is a sync spooled file; copy it in C off the event loop
+    with dest.open("wb") as f:
+        shutil.copyfileobj(uf.file, f, 1024 * 1024)
+
 @app.post("/core/upload-folder")
 async def upload_folder(
     files: List[UploadFile] = File(..., description="Multiple files with webkitRelativePath"),
     root: str = Form("core_project"),
 ):
     reset_project_dir()
-    saved = 0
-    for uf in files:
-        rel_path = Path(uf.filename)  # contains relative path from browser
-        dest = PROJECT_DIR / rel_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        with dest.open("wb") as f:
-            while chunk := await uf.read(1024 * 1024):
-                f.write(chunk)
-        saved += 1
+    dests = [PROJECT_DIR / Path(uf.filename) for uf in files]  # contains relative path from browser
+    for parent in {d.parent for d in dests}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    # Many small files (typical webkitdirectory upload) -> overlap the open/write/close syscalls
+    sem = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def _save_one(uf: UploadFile, dest: Path) -> None:
+        async with sem:
+            await run_in_threadpool(_copy_upload, uf, dest)
+
+    await asyncio.gather(*[_save_one(uf, dest) for uf, dest in zip(files, dests)])
+    saved = len(files)
     write_meta({"mode": "folder", "root": root, "files": saved})
+    _invalidate_plugins_cache()
     return {"ok": True, "message": f"Folder uploaded with {saved} files."}
 
 # ==============================================================================
@@ -180,30 +247,43 @@ def status():
 def core_tree(dir: str = ""):
     if not _project_present():
         raise HTTPException(404, detail="No project uploaded")
-    base = _safe_join(PROJECT_DIR, dir)
+    base = _safe_join(PROJECT_DIR_RESOLVED, dir)
     if not base.exists() or not base.is_dir():
         raise HTTPException(404, detail="Folder not found")
 
-    items = []
-    for entry in sorted(base.iterdir(), key=lambda x: (x.is_file(), x.name.lower())):
-        items.append({
-            "name": entry.name,
-            "path": str(entry.relative_to(PROJECT_DIR)),
-            "type": "file" if entry.is_file() else "dir",
-        })
-    return {"cwd": str(base.relative_to(PROJECT_DIR)), "items": items}
+    # DirEntry.is_file() is answered from the dirent, so each entry is stat'ed at most once
+    with os.scandir(base) as it:
+        entries = [(e.name, e.is_file()) for e in it]
+    entries.sort(key=lambda t: (t[1], t[0].lower()))
+
+    rel_base = base.relative_to(PROJECT_DIR)
+    items = [
+        {
+            "name": name,
+            "path": str(rel_base / name),
+            "type": "file" if is_file else "dir",
+        }
+        for name, is_file in entries
+    ]
+    return {"cwd": str(rel_base), "items": items}
 
 @app.get("/core/file")
-def core_file(path: str = Query(..., description="Relative path inside project")):
+def core_file(
+    path: str = Query(..., description="Relative path inside project"),
+    raw: bool = Query(False, description="Return the file body as text/plain instead of JSON"),
+):
     if not _project_present():
         raise HTTPException(404, detail="No project uploaded")
-    fpath = _safe_join(PROJECT_DIR, path)
-    if not fpath.exists() or not fpath.is_file():
+    fpath = _safe_join(PROJECT_DIR_RESOLVED, path)
+    if not fpath.is_file():
         raise HTTPException(404, detail="File not found")
+    if raw:
+        # Starlette streams the file (sendfile where available), no Python-side copy
+        return FileResponse(str(fpath), media_type="text/plain")
     if fpath.stat().st_size > 1_000_000:
         raise HTTPException(413, detail="File too large to preview")
-    content = fpath.read_text(encoding="utf-8", errors="ignore")
-    return {"path": path, "content": content}
+    content = fpath.read_bytes().decode("utf-8", errors="ignore")
+    return Response(orjson.dumps({"path": path, "content": content}), media_type="application/json")
 
 @app.post("/core/save")
 def core_save(
@@ -212,26 +292,39 @@ def core_save(
 ):
     if not _project_present():
         raise HTTPException(404, detail="No project uploaded")
-    fpath = _safe_join(PROJECT_DIR, path)
+    fpath = _safe_join(PROJECT_DIR_RESOLVED, path)
     fpath.parent.mkdir(parents=True, exist_ok=True)
     fpath.write_text(content, encoding="utf-8")
+    _invalidate_plugins_cache()
     return {"ok": True, "path": path}
 
 # ==============================================================================
 # Plugins (files + discovery)
 # ==============================================================================
+# /core/plugins is polled by the UI; manifests are only rescanned after a mutation
+_PLUGINS_VERSION = 0
+_PLUGINS_CACHE: Dict[str, object] = {"version": -1, "data": None}
+
+def _invalidate_plugins_cache() -> None:
+    global _PLUGINS_VERSION
+    _PLUGINS_VERSION += 1
+
 @app.post("/core/plugin/new")
 def create_plugin(
     path: str = Query(..., description="Relative path under ai_plugins/"),
     content: str = Body(..., media_type="text/plain"),
 ):
-    dest = _safe_join(PLUGINS_DIR, path)
+    dest = _safe_join(PLUGINS_DIR_RESOLVED, path)
     dest.parent.mkdir(parents=True, exist_ok=True)
     dest.write_text(content, encoding="utf-8")
+    _invalidate_plugins_cache()
     return {"ok": True, "path": str(dest.relative_to(PROJECT_DIR))}
 
 @app.get("/core/plugins")
 def list_plugins():
+    if _PLUGINS_CACHE["version"] == _PLUGINS_VERSION:
+        return {"plugins": _PLUGINS_CACHE["data"]}
+    version = _PLUGINS_VERSION
     out = []
     for mf in PLUGINS_DIR.rglob("manifest.json"):
         try:
@@ -247,64 +340,16 @@ def list_plugins():
             })
         except Exception:
             pass
+    _PLUGINS_CACHE["version"] = version
+    _PLUGINS_CACHE["data"] = out
     return {"plugins": out}
 
 # ==============================================================================
 # Node project discovery + start helpers (HOST mode)
 # ==============================================================================
-def _read_package_json(root: Path) -> dict:
-    try:
-        return json.loads((root / "package.json").read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-
-def _node_candidates(max_depth: int = 3) -> List[Path]:
-    if not PROJECT_DIR.exists():
-        return []
-    out: List[Path] = []
-    for pkg in PROJECT_DIR.rglob("package.json"):
-        if "node_modules" in pkg.parts:
-            continue
-        try:
-            rel = pkg.parent.relative_to(PROJECT_DIR)
-        except ValueError:
-            continue
-        if len(rel.parts) <= max_depth:
-            out.append(rel)
-    return sorted(out, key=lambda p: (len(p.parts), str(p)))
-
-def _pick_best_node_root(candidates: List[Path]) -> Optional[Path]:
-    best = None
-    best_score = -10_000
-    for rel in candidates:
-        root = PROJECT_DIR / rel
-        pkg = _read_package_json(root)
-        scripts = pkg.get("scripts") or {}
-
-        score = 0
-        name = rel.name.lower()
-        if name in ("frontend", "web", "app", "ui"): score += 3
-        if "start" in scripts: score += 3
-        if "dev" in scripts: score += 2
-        if (root / "server.js").exists() or (root / "index.js").exists() or (root / "app.js").exists():
-            score += 1
-        score -= len(rel.parts)
-        if score > best_score:
-            best_score = score
-            best = root
-    return best
-
-def _node_project_root(subdir: Optional[str]) -> Optional[Path]:
-    if subdir:
-        cand = (PROJECT_DIR / subdir)
-        if (cand / "package.json").exists():
-            return cand
-    cands = _node_candidates()
-    return _pick_best_node_root(cands)
-
 @app.get("/core/node-candidates")
 def node_candidates():
-    return {"candidates": [str(p).replace("\\", "/") for p in _node_candidates()]}
+    return {"candidates": [str(p).replace("\\", "/") for p in find_node_candidates()]}
 
 def _ensure_node_deps(root: Path):
     npm = _which(_npm_exe())
@@ -361,14 +406,14 @@ def start_core(
     prefer: Optional[str] = Query(None, description="Force 'node' or 'java'"),
     subdir: Optional[str] = Query(None, description="Node app subdir (contains package.json)"),
 ):
-    node_root = _node_project_root(subdir)
+    node_root = node_project_root(subdir)
 
     try_node_first = (prefer == "node") or (prefer is None and node_root is not None)
     try_java_first = (prefer == "java")
 
     if try_node_first and node_root:
         _ensure_node_deps(node_root)
-        cmd = _pick_node_start_command(_read_package_json(node_root), node_root)
+        cmd = _pick_node_start_command(read_package_json(node_root), node_root)
         env = os.environ.copy()
         if port:
             env["PORT"] = str(port)
@@ -398,15 +443,16 @@ def start_core(
 PIDS_FILE = STORAGE_DIR / "pids.json"
 
 def _read_pids() -> Dict[str, int]:
-    if PIDS_FILE.exists():
-        try:
-            return json.loads(PIDS_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
+    try:
+        return orjson.loads(PIDS_FILE.read_bytes())
+    except Exception:
+        return {}
 
 def _write_pids(pids: Dict[str, int]) -> None:
-    PIDS_FILE.write_text(json.dumps(pids, indent=2), encoding="utf-8")
+    # Write-then-rename so a crash never leaves a truncated pids.json behind
+    tmp = PIDS_FILE.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(pids, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, PIDS_FILE)
 
 def _add_pid(key: str, pid: int) -> None:
     p = _read_pids()
@@ -431,14 +477,14 @@ def start_both(req: StartBothReq):
 
     for rel in req.subdirs:
         rel = rel.strip().strip("/").replace("\\", "/")
-        root = (PROJECT_DIR / rel).resolve()
-        if not str(root).startswith(str(PROJECT_DIR.resolve())):
+        root = (PROJECT_DIR_RESOLVED / rel).resolve()
+        if not root.is_relative_to(PROJECT_DIR_RESOLVED):
             raise HTTPException(400, detail=f"Invalid subdir: {rel}")
         if not (root / "package.json").exists():
             raise HTTPException(404, detail=f"package.json not found in {rel}")
 
         _ensure_node_deps(root)
-        cmd = _pick_node_start_command(_read_package_json(root), root)
+        cmd = _pick_node_start_command(read_package_json(root), root)
 
         try:
             proc = subprocess.Popen(
@@ -463,6 +509,8 @@ def start_both(req: StartBothReq):
 # ==============================================================================
 # Docker RUN (per-subdir)
 # ==============================================================================
+_SUBDIR_SEP_RE = re.compile(r"[\\/]+")
+
 def _docker_run_for_subdir(cfg: DockerStartReq) -> Dict[str, str]:
     """
     docker run -d --restart unless-stopped
@@ -477,26 +525,26 @@ def _docker_run_for_subdir(cfg: DockerStartReq) -> Dict[str, str]:
 
     # Normalize and validate subdir
     rel = cfg.subdir.strip().strip("/").replace("\\", "/")
-    host_path = (PROJECT_DIR / rel).resolve()
-    if not str(host_path).startswith(str(PROJECT_DIR.resolve())):
+    host_path = (PROJECT_DIR_RESOLVED / rel).resolve()
+    if not host_path.is_relative_to(PROJECT_DIR_RESOLVED):
         raise HTTPException(400, detail=f"Invalid subdir: {cfg.subdir}")
-    if not (host_path / "package.json").exists():
+    try:
+        os.stat(host_path / "package.json")
+    except (FileNotFoundError, NotADirectoryError):
         raise HTTPException(404, detail=f"package.json not found in {cfg.subdir}")
 
     # Stable, human-friendly container name from the subdir
-    safe_rel = re.sub(r"[\\/]+", "_", rel)
+    safe_rel = _SUBDIR_SEP_RE.sub("_", rel)
     name = cfg.name or f"safeai_{safe_rel}"
     docker = _docker_exe()
 
     # --- PRE-CLEAN: remove any existing container with the same name ---
+    # (one in-process API call over the shared SDK client instead of `docker ps` + `docker rm`)
     try:
-        probe = subprocess.run(
-            [docker, "ps", "-a", "--filter", f"name=^{name}$", "--format", "{{.ID}}"],
-            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False, text=True
-        )
-        existing_id = (probe.stdout or "").strip()
-        if existing_id:
-            subprocess.run([docker, "rm", "-f", name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        existing = docker_client.containers.list(all=True, filters={"name": f"^{name}$"})
+        for c in existing:
+            c.remove(force=True)
+        if existing:
             try:
                 remove_container(rel)
             except Exception:
@@ -505,9 +553,6 @@ def _docker_run_for_subdir(cfg: DockerStartReq) -> Dict[str, str]:
         pass
     # -------------------------------------------------------------------
 
-    # Build base args
-    args = [docker, "run", "-d", "--restart", "unless-stopped", "--name", name]
-
     # ---- Environment defaults + port auto-map ----
     env_map = dict(cfg.env or {})
     env_map.setdefault("HOST", "0.0.0.0")
@@ -528,26 +573,22 @@ def _docker_run_for_subdir(cfg: DockerStartReq) -> Dict[str, str]:
         except Exception:
             pass
 
-    # Apply envs
-    for k, v in env_map.items():
-        args += ["-e", f"{k}={v}"]
-
-    # Apply port mappings (now that auto_ports is finalized)
-    for p in auto_ports:
-        args += ["-p", p]
-
-    # Workdir + bind mount
-    args += ["-w", cfg.workdir, "-v", f"{str(host_path)}:{cfg.workdir}"]
-
-    # Image + command (install then start)
+    # Build the full argv in one go (envs, port mappings, workdir + bind mount,
+    # image + command that installs then starts)
+    env_args = [x for k, v in env_map.items() for x in ("-e", f"{k}={v}")]
+    port_args = [x for p in auto_ports for x in ("-p", p)]
     cmd = f"{cfg.install} && {cfg.start}"
-    args += [cfg.image, "sh", "-lc", cmd]
+    args = [
+        docker, "run", "-d", "--restart", "unless-stopped", "--name", name,
+        *env_args,
+        *port_args,
+        "-w", cfg.workdir, "-v", f"{host_path}:{cfg.workdir}",
+        cfg.image, "sh", "-lc", cmd,
+    ]
 
-    _append_log(f"DOCKER: {' '.join(args)}")
     proc = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=False, text=True)
     out = (proc.stdout or "").strip()
-    with BUILD_LOG.open("a", encoding="utf-8") as f:
-        f.write(out + "\n")
+    _append_log(f"DOCKER: {' '.join(args)}\n{out}")
 
     if proc.returncode != 0 or not out:
         raise HTTPException(500, detail=f"Docker failed to run {cfg.subdir}: {out or proc.returncode}")
@@ -568,26 +609,47 @@ def docker_start(cfg: DockerStartReq):
 
 @app.post("/core/docker/start-both", summary="Run MANY uploaded subdirs inside Docker containers")
 def docker_start_many(req: DockerStartManyReq):
-    started = {}
+    if not req.apps:
+        raise HTTPException(400, detail="Provide at least one app")
+    # Results are keyed by subdir (as is the container registry), so each may appear once
+    seen, dupes = set(), set()
     for app_cfg in req.apps:
-        res = _docker_run_for_subdir(app_cfg)
-        started[app_cfg.subdir] = res
-    return {"ok": True, "containers": started}
+        rel = app_cfg.subdir.strip().strip("/").replace("\\", "/")
+        if rel in seen:
+            dupes.add(rel)
+        seen.add(rel)
+    if dupes:
+        raise HTTPException(400, detail=f"Duplicate subdirs: {', '.join(sorted(dupes))}")
+    # Each start is docker CLI I/O, so run them side by side; one failure doesn't stop the rest
+    started: Dict[str, Dict[str, str]] = {}
+    errors: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(req.apps))) as ex:
+        futures = {ex.submit(_docker_run_for_subdir, app_cfg): app_cfg.subdir for app_cfg in req.apps}
+        for fut in as_completed(futures):
+            subdir = futures[fut]
+            try:
+                started[subdir] = fut.result()
+            except HTTPException as e:
+                errors[subdir] = str(e.detail)
+            except Exception as e:
+                errors[subdir] = str(e)
+    if errors and not started:
+        raise HTTPException(500, detail="; ".join(f"{k}: {v}" for k, v in errors.items()))
+    return {"ok": not errors, "containers": started, "errors": errors}
 
 @app.get("/core/docker/containers")
 def docker_containers():
     return {"containers": read_containers()}
 
 # ---- Simple helper to convert port mappings to http://localhost URLs ----
+_LOCALHOST_URL = "http://localhost:"
+
 def _ports_to_urls(ports: List[str] | None) -> List[str]:
     urls: List[str] = []
     for m in (ports or []):
-        try:
-            host, _cont = m.split(":", 1)
-            if host.isdigit():
-                urls.append(f"http://localhost:{host}")
-        except Exception:
-            continue
+        host, sep, _cont = str(m).partition(":")
+        if sep and host.isdigit():
+            urls.append(_LOCALHOST_URL + host)
     return urls
 
 @app.get("/core/docker/urls")
@@ -602,6 +664,13 @@ def docker_urls():
         out[rel] = _ports_to_urls(ports)
     return {"urls": out}
 
+def _remove_container_by_id(cid: str) -> None:
+    # remove(force=True) kills + removes in one API call; already gone counts as removed
+    try:
+        docker_client.containers.get(cid).remove(force=True)
+    except NotFound:
+        pass
+
 @app.post("/core/docker/stop", summary="Stop & remove ONE container by subdir")
 def docker_stop(subdir: str = Query(..., description="The subdir key you used when starting")):
     _ensure_docker()
@@ -612,24 +681,31 @@ def docker_stop(subdir: str = Query(..., description="The subdir key you used wh
     cid = rec.get("id")
     if not cid:
         raise HTTPException(404, detail=f"No container id stored for {rel}")
-    docker = _docker_exe()
-    subprocess.run([docker, "stop", cid], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    subprocess.run([docker, "rm", "-f", cid], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _remove_container_by_id(cid)
     remove_container(rel)
     return {"ok": True, "stopped": rel, "id": cid}
 
 @app.post("/core/docker/stop-all", summary="Stop & remove ALL recorded containers")
 def docker_stop_all():
     _ensure_docker()
-    docker = _docker_exe()
     data = read_containers()
-    for rel, rec in list(data.items()):
-        cid = (rec or {}).get("id")
-        if not cid:
-            continue
-        subprocess.run([docker, "stop", cid], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        subprocess.run([docker, "rm", "-f", cid], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        remove_container(rel)
+    tracked = {rel: cid for rel, rec in data.items() if (cid := (rec or {}).get("id"))}
+    # Removals are independent API calls, so issue them side by side.
+    # Only containers that are really gone are dropped from the registry.
+    errors: Dict[str, str] = {}
+    if tracked:
+        with ThreadPoolExecutor(max_workers=min(8, len(tracked))) as ex:
+            futures = {ex.submit(_remove_container_by_id, cid): rel for rel, cid in tracked.items()}
+            for fut in as_completed(futures):
+                rel = futures[fut]
+                try:
+                    fut.result()
+                except Exception as e:
+                    errors[rel] = str(e)
+                    continue
+                remove_container(rel)
+    if errors:
+        return {"ok": False, "message": "Some containers could not be removed.", "errors": errors}
     return {"ok": True, "message": "All containers stopped/removed."}
 
 # ==============================================================================
@@ -637,47 +713,36 @@ def docker_stop_all():
 # ==============================================================================
 @app.post("/core/stop")
 def stop_core():
-    # Kill multi-PIDs
-    pids_file = STORAGE_DIR / "pids.json"
-    if pids_file.exists():
+    # Multi-PIDs from pids.json plus the legacy single PID
+    all_pids = list(_read_pids().values())
+    legacy = read_pid()
+    if legacy:
+        all_pids.append(legacy)
+
+    procs = []
+    for pid in all_pids:
         try:
-            pids = json.loads(pids_file.read_text(encoding="utf-8"))
+            procs.append(psutil.Process(pid))
         except Exception:
-            pids = {}
-    else:
-        pids = {}
+            pass
 
-    for key, pid in list(pids.items()):
+    # Signal everything first, then wait on all of them together so the
+    # worst case is one timeout rather than one per process
+    for p in procs:
         try:
-            import psutil
-            p = psutil.Process(pid)
             p.terminate()
-            try:
-                p.wait(timeout=8)
-            except Exception:
-                p.kill()
-        except Exception:
+        except psutil.Error:
             pass
-    try:
-        pids_file.unlink(missing_ok=True)
-    except Exception:
-        pass
-
-    # Kill legacy single PID
-    pid = read_pid()
-    if pid:
+    _gone, alive = psutil.wait_procs(procs, timeout=8)
+    for p in alive:
         try:
-            import psutil
-            p = psutil.Process(pid)
-            p.terminate()
-            try:
-                p.wait(timeout=8)
-            except Exception:
-                p.kill()
-        except Exception:
+            p.kill()
+        except psutil.Error:
             pass
-        finally:
-            clear_pid()
+
+    _clear_pids()
+    if legacy:
+        clear_pid()
 
     return {"ok": True, "message": "Stopped all host processes."}
 
@@ -692,9 +757,10 @@ def core_delete(
     if not _project_present():
         raise HTTPException(404, detail="No project uploaded")
 
-    target = _safe_join(PROJECT_DIR, path)
+    target = _safe_join(PROJECT_DIR_RESOLVED, path)
     if not target.exists():
         raise HTTPException(404, detail="Path not found")
+    _invalidate_plugins_cache()
 
     if target.is_file():
         target.unlink(missing_ok=True)
@@ -727,6 +793,7 @@ def core_reset():
 
     # Clear uploaded project
     reset_project_dir()
+    _invalidate_plugins_cache()
 
     # Remove legacy artifacts
     try: JAR_FILE.unlink(missing_ok=True)
@@ -1,7 +1,9 @@
+import functools
 import time
 import re
 import uuid
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 import docker
 
 docker_client = docker.from_env()
@@ -9,6 +11,12 @@ docker_client = docker.from_env()
 PLUGINS_ROOT = (Path(__file__).resolve().parents[1] / "storage" / "core_project" / "ai_plugins").resolve()
 SLUG_RE = re.compile(r"^[A-Za-z0-9._-]+$")
 
+# container name -> (State.StartedAt, published host port of 9000/tcp). The port is
+# only stable for one run of the container, so an entry whose StartedAt no longer
+# matches (the daemon restarted it) is ignored. Dropped on stop, on a fresh
+# containers.run and on any connection failure to the port.
+_port_cache: Dict[str, Tuple[str, str]] = {}
+
 
 def _sanitize_slug(slug: str) -> str:
     if not SLUG_RE.match(slug or ""):
@@ -16,17 +24,41 @@ def _sanitize_slug(slug: str) -> str:
     return slug
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_plugin_folder(slug: str) -> Path:
+    # Pure path resolution, cached per slug; existence is still checked on every call
+    return (PLUGINS_ROOT / slug).resolve()
+
+
 def _plugin_folder(slug: str) -> Path:
-    p = (PLUGINS_ROOT / slug).resolve()
+    p = _resolve_plugin_folder(slug)
     if not p.exists() or not (p / "entry.js").exists():
         raise FileNotFoundError(f"Plugin folder not found or missing entry.js: {p}")
-    if PLUGINS_ROOT not in p.parents:
+    if p == PLUGINS_ROOT or not p.is_relative_to(PLUGINS_ROOT):
         raise ValueError(f"Path traversal detected: {p}")
     return p
 
 
+def _started_at(container) -> str:
+    return container.attrs.get("State", {}).get("StartedAt", "")
+
+
+def _cached_host_port(container) -> Optional[str]:
+    # Only valid for the run it was read from; container.attrs must be current
+    hit = _port_cache.get(container.name)
+    if hit and hit[0] == _started_at(container):
+        return hit[1]
+    return None
+
+
+def invalidate_plugin_host_port(container) -> None:
+    """Forget the cached port, e.g. after a connection to it failed."""
+    _port_cache.pop(container.name, None)
+
+
 def _find_existing_container(name: str):
-    lst = docker_client.containers.list(all=True, filters={"name": name})
+    # Exact match (the name filter is a regex), and the list response already carries .status
+    lst = docker_client.containers.list(all=True, filters={"name": f"^{name}$"})
     return lst[0] if lst else None
 
 # ---------------------------------------------------------------------------
@@ -56,6 +88,7 @@ def _wait_for_port(container, inner_port: str = "9000/tcp", timeout: int = 15) -
         if bindings:
             host_port = bindings[0].get("HostPort")
             if host_port:
+                _port_cache[container.name] = (_started_at(container), host_port)
                 return host_port
 
         time.sleep(0.4)
@@ -89,10 +122,12 @@ def start_plugin_container(
     if reuse:
         existing = _find_existing_container(name)
         if existing:
-            existing.reload()
-            if existing.attrs["State"]["Status"] != "running":
+            # list() inspects each container, so StartedAt is current unless we start it here
+            if existing.status != "running":
+                _port_cache.pop(name, None)
                 existing.start()
-            _wait_for_port(existing)
+            if _cached_host_port(existing) is None:
+                _wait_for_port(existing)
             return existing
 
 
@@ -103,6 +138,8 @@ def start_plugin_container(
     # publish container 9000 to a random host port
     ports = {"9000/tcp": None}
 
+    # whatever was cached under this name belonged to an earlier container
+    _port_cache.pop(name, None)
     container = docker_client.containers.run(
         image="ai-plugin-runner:1",
         name=name,
@@ -121,11 +158,12 @@ def stop_plugin_container(slug: str, instance_id: str | None = None) -> bool:
     slug = _sanitize_slug(slug)
     base_name = f"plugin_{slug}"
     name = base_name if instance_id is None else f"{base_name}_{instance_id}"
+    _port_cache.pop(name, None)
     existing = _find_existing_container(name)
     if not existing:
         return False
-    existing.stop()
-    existing.remove()
+    # Runner containers hold no state worth a graceful shutdown: kill + remove in one call
+    existing.remove(force=True)
     return True
 
 
@@ -134,6 +172,9 @@ def get_plugin_host_port(container) -> str:
     Read the host port from an already-started (and port-bound) container.
     Raises RuntimeError if the port mapping is missing.
     """
+    cached = _cached_host_port(container)
+    if cached:
+        return cached
     container.reload()
     ports = container.attrs.get("NetworkSettings", {}).get("Ports", {})
     bindings = ports.get("9000/tcp")
@@ -147,4 +188,5 @@ def get_plugin_host_port(container) -> str:
         raise RuntimeError(
             f"Container '{container.name}' port binding exists but HostPort is empty."
         )
+    _port_cache[container.name] = (_started_at(container), host_port)
     return host_port
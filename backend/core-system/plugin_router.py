@@ -1,12 +1,20 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 import requests
+from requests.adapters import HTTPAdapter
 
-from plugin_manager import start_plugin_container, stop_plugin_container, get_plugin_host_port, PLUGINS_ROOT
+from plugin_manager import (
+    start_plugin_container, stop_plugin_container, get_plugin_host_port,
+    invalidate_plugin_host_port, PLUGINS_ROOT,
+)
 from interface_enforcer import enforce_interface
 
 router = APIRouter()
 
+# Shared keep-alive pool for calls into plugin runner containers on loopback
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+
 class StartPayload(BaseModel):
     slug: str
     reuse: bool = True
@@ -84,11 +92,17 @@ def run_plugin(body: RunPayload):
         host_port = get_plugin_host_port(c)
         url = f"http://127.0.0.1:{host_port}/run"
 
-        r = requests.post(
-            url,
-            json={"input": body.input or {}, "metadata": body.metadata or {}},
-            timeout=30
-        )
+        try:
+            r = _session.post(
+                url,
+                json={"input": body.input or {}, "metadata": body.metadata or {}},
+                headers={"Connection": "keep-alive"},
+                timeout=30
+            )
+        except requests.ConnectionError:
+            # stale port (container restarted on a new one, or gone): re-read it next time
+            invalidate_plugin_host_port(c)
+            raise
 
         # if runner fails, return its text/json in detail
         if r.status_code >= 400:
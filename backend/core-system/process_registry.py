@@ -1,7 +1,10 @@
 # SAFE-AI-FRAMEWORK/backend/process_registry.py
 from pathlib import Path
 from typing import Optional, List, Dict
-import json, psutil, shutil
+import functools, json, os, psutil, shutil, threading, time
+from collections import deque
+
+import orjson
 
 # -----------------------------------------------------------------------------
 # Storage layout (outside backend to prevent uvicorn reload loops)
@@ -18,6 +21,8 @@ PROJECT_DIR = STORAGE_DIR / "core_project"      # full uploaded project
 
 # New: container tracking (for Docker-run core apps)
 CONTAINERS_FILE = STORAGE_DIR / "containers.json"
+# containers.json is read-modify-written from docker worker threads
+_REG_LOCK = threading.RLock()
 
 # -----------------------------------------------------------------------------
 # Single PID helpers (legacy)
@@ -46,32 +51,56 @@ def is_running() -> bool:
     except psutil.Error:
         return False
 
+# -----------------------------------------------------------------------------
+# JSON-backed registries: kept in memory, written atomically on every change
+# -----------------------------------------------------------------------------
+def _load_json(path: Path) -> Dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+def _atomic_write_json(path: Path, data: Dict) -> None:
+    # Write-then-rename so readers never see a half-written file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
 # -----------------------------------------------------------------------------
 # Multi-PID helpers (for starting multiple node apps)
 # -----------------------------------------------------------------------------
+_PIDS_LOCK = threading.RLock()
+_PIDS_CACHE: Optional[Dict[str, Dict]] = None
+
+def _pids() -> Dict[str, Dict]:
+    global _PIDS_CACHE
+    if _PIDS_CACHE is None:
+        _PIDS_CACHE = _load_json(PIDS_FILE)
+    return _PIDS_CACHE
+
 def read_pids() -> Dict[str, Dict]:
-    if PIDS_FILE.exists():
-        try:
-            return json.loads(PIDS_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
+    with _PIDS_LOCK:
+        return dict(_pids())
 
 def write_pids(data: Dict) -> None:
-    PIDS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    PIDS_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    global _PIDS_CACHE
+    with _PIDS_LOCK:
+        _PIDS_CACHE = dict(data)
+        _atomic_write_json(PIDS_FILE, _PIDS_CACHE)
 
 def add_pid(name: str, pid: int, cwd: Optional[Path] = None) -> None:
     """
     Store a pid under a human-readable key (e.g. 'frontend', 'backend').
     'cwd' is optional so calls like add_pid(name, pid) still work.
     """
-    data = read_pids()
     rec: Dict[str, str | int] = {"pid": pid}
     if cwd is not None:
         rec["cwd"] = str(cwd)
-    data[name] = rec
-    write_pids(data)
+    with _PIDS_LOCK:
+        data = _pids()
+        data[name] = rec
+        _atomic_write_json(PIDS_FILE, data)
 
 def clear_pids() -> None:
     write_pids({})
@@ -79,35 +108,44 @@ def clear_pids() -> None:
 # -----------------------------------------------------------------------------
 # Docker container tracking (used by /core/docker/* endpoints in main.py)
 # -----------------------------------------------------------------------------
+_CONTAINERS_CACHE: Optional[Dict[str, Dict]] = None
+
+def _containers() -> Dict[str, Dict]:
+    global _CONTAINERS_CACHE
+    if _CONTAINERS_CACHE is None:
+        _CONTAINERS_CACHE = _load_json(CONTAINERS_FILE)
+    return _CONTAINERS_CACHE
+
 def read_containers() -> Dict[str, Dict]:
     """
     Returns a mapping: subdir -> { "id": <container_id>, "info": {...} }
+    The file is parsed once; later reads are served from memory.
     """
-    if CONTAINERS_FILE.exists():
-        try:
-            return json.loads(CONTAINERS_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
+    with _REG_LOCK:
+        return dict(_containers())
 
 def write_containers(data: Dict[str, Dict]) -> None:
-    CONTAINERS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    CONTAINERS_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    global _CONTAINERS_CACHE
+    with _REG_LOCK:
+        _CONTAINERS_CACHE = dict(data)
+        _atomic_write_json(CONTAINERS_FILE, _CONTAINERS_CACHE)
 
 def add_container(name: str, container_id: str, info: Optional[Dict] = None) -> None:
     """
     Track a started container under a human-readable key (usually the project subdir).
     Example info: {"name": "safeai_frontend", "port": 5173}
     """
-    data = read_containers()
-    data[name] = {"id": container_id, "info": info or {}}
-    write_containers(data)
+    with _REG_LOCK:
+        data = _containers()
+        data[name] = {"id": container_id, "info": info or {}}
+        _atomic_write_json(CONTAINERS_FILE, data)
 
 def remove_container(name: str) -> None:
-    data = read_containers()
-    if name in data:
-        del data[name]
-        write_containers(data)
+    with _REG_LOCK:
+        data = _containers()
+        if name in data:
+            del data[name]
+            _atomic_write_json(CONTAINERS_FILE, data)
 
 def clear_containers() -> None:
     write_containers({})
@@ -123,12 +161,10 @@ def project_present() -> bool:
     Treat project as present if the project directory exists and has at least
     one entry (file OR folder).
     """
-    if not PROJECT_DIR.exists():
-        return False
     try:
-        next(PROJECT_DIR.iterdir())
-        return True
-    except StopIteration:
+        with os.scandir(PROJECT_DIR) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
         return False
 
 def reset_project_dir() -> None:
@@ -136,6 +172,27 @@ def reset_project_dir() -> None:
         shutil.rmtree(PROJECT_DIR)
     PROJECT_DIR.mkdir(parents=True, exist_ok=True)
 
+# -----------------------------------------------------------------------------
+# Detection caches: /core/status is polled, so full-tree scans are reused until
+# PROJECT_DIR's mtime changes. That mtime only tracks top-level entries, so a
+# short TTL bounds staleness for deeper edits.
+# -----------------------------------------------------------------------------
+DETECT_CACHE_TTL = 5.0
+_jar_cache: Dict[str, object] = {"key": None, "expires": 0.0, "val": None}
+_kind_cache: Dict[str, object] = {"key": None, "expires": 0.0, "val": None}
+
+def _cached(cache: Dict[str, object], compute):
+    try:
+        key = PROJECT_DIR.stat().st_mtime_ns
+    except OSError:
+        key = 0
+    now = time.monotonic()
+    if cache["key"] == key and cache["expires"] > now:
+        return cache["val"]
+    val = compute()
+    cache.update(key=key, expires=now + DETECT_CACHE_TTL, val=val)
+    return val
+
 # -----------------------------------------------------------------------------
 # Java detection (legacy)
 # -----------------------------------------------------------------------------
@@ -147,6 +204,9 @@ def find_runnable_jar() -> Optional[Path]:
     """
     if JAR_FILE.exists():
         return JAR_FILE
+    return _cached(_jar_cache, _scan_project_jar)
+
+def _scan_project_jar() -> Optional[Path]:
     if project_present():
         candidates = [p for p in PROJECT_DIR.rglob("*.jar") if p.is_file()]
         def score(p: Path) -> int:
@@ -166,38 +226,78 @@ def java_present() -> bool:
 # -----------------------------------------------------------------------------
 # Node detection (monorepos supported)
 # -----------------------------------------------------------------------------
+NODE_CANDIDATES_TTL = 2.0
+# Never descended into when looking for package.json, on top of hidden dirs
+# (.git, .next, .cache, ...): dependencies and build output
+_NODE_SKIP_DIRS = {"node_modules", "dist", "build"}
+_node_cands_cache: Dict[tuple, tuple] = {}   # (max_depth, PROJECT_DIR mtime) -> (expires, result)
+
+def _scan_node_candidates(max_depth: int) -> List[Path]:
+    # BFS with os.scandir; _NODE_SKIP_DIRS and hidden dirs are never entered,
+    # and nothing below max_depth is listed at all
+    cands: List[Path] = []
+    queue = deque([(PROJECT_DIR, Path(), 0)])
+    while queue:
+        d, rel, depth = queue.popleft()
+        subdirs = []
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    name = entry.name
+                    if name == "package.json" and entry.is_file():
+                        cands.append(rel)
+                    elif depth < max_depth and entry.is_dir() and name not in _NODE_SKIP_DIRS and not name.startswith("."):
+                        subdirs.append(name)
+        except OSError:
+            continue
+        for name in subdirs:
+            queue.append((Path(d) / name, rel / name, depth + 1))
+    return cands
+
 def node_candidates(max_depth: int = 3) -> List[Path]:
     """
     Return candidate folders (relative to PROJECT_DIR) that contain package.json.
-    Skips node_modules. Limits depth for performance.
+    Skips node_modules, dist/build output and hidden dirs. Limits depth for performance.
+    The result is cached for a couple of seconds since /core/status is polled.
     """
-    if not PROJECT_DIR.exists():
+    try:
+        mtime = PROJECT_DIR.stat().st_mtime_ns
+    except OSError:
         return []
-    cands: List[Path] = []
-    for pkg in PROJECT_DIR.rglob("package.json"):
-        if "node_modules" in pkg.parts:
-            continue
-        try:
-            rel = pkg.parent.relative_to(PROJECT_DIR)
-        except ValueError:
-            continue
-        if len(rel.parts) <= max_depth:
-            cands.append(rel)
+    key = (max_depth, mtime)
+    now = time.monotonic()
+    hit = _node_cands_cache.get(key)
+    if hit and hit[0] > now:
+        return list(hit[1])
+    cands = _scan_node_candidates(max_depth)
     # Prefer shallow paths, then alphabetically
-    return sorted(cands, key=lambda p: (len(p.parts), str(p)))
+    cands.sort(key=lambda p: (len(p.parts), str(p)))
+    _node_cands_cache.clear()
+    _node_cands_cache[key] = (now + NODE_CANDIDATES_TTL, tuple(cands))
+    return cands
 
-def _read_package_json(root: Path) -> dict:
+@functools.lru_cache(maxsize=256)
+def _read_package_json_cached(path: str, mtime_ns: int) -> dict:
+    # mtime_ns is only part of the cache key: an edited package.json gets a new entry
     try:
-        return json.loads((root / "package.json").read_text(encoding="utf-8"))
+        return orjson.loads(Path(path).read_bytes())
     except Exception:
         return {}
 
+def read_package_json(root: Path) -> dict:
+    """Parsed package.json of `root` ({} if missing/invalid). Treat the result as read-only."""
+    p = root / "package.json"
+    try:
+        return _read_package_json_cached(str(p), p.stat().st_mtime_ns)
+    except OSError:
+        return {}
+
 def _score_node_root(rel: Path) -> int:
     """
     Heuristic: prefer frontend/web/app/ui names, prefer start/dev scripts, prefer shallower.
     """
     root = PROJECT_DIR / rel
-    pkg = _read_package_json(root)
+    pkg = read_package_json(root)
     scripts = pkg.get("scripts") or {}
     score = 0
     name = rel.name.lower()
@@ -240,6 +340,9 @@ def node_present() -> bool:
 # -----------------------------------------------------------------------------
 def project_kind() -> Optional[str]:
     """Return 'node' | 'java' | None (prefers node if both present)."""
+    return _cached(_kind_cache, _detect_project_kind)
+
+def _detect_project_kind() -> Optional[str]:
     if node_present():
         return "node"
     if java_present():
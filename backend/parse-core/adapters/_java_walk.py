@@ -0,0 +1,212 @@
+"""
+Method-body traversal and ordered call extraction for the Java adapter.
+
+Kept in its own small, fully annotated module so it can be compiled ahead of
+time with mypyc:
+
+    cd backend/parse-core && mypyc adapters/_java_walk.py
+
+A compiled extension module sitting next to this file is imported in its
+place automatically; without one, this pure-Python version is used.
+"""
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import javalang  # type: ignore
+from javalang.ast import Node  # type: ignore
+
+CallList = List[Dict[str, Any]]
+
+# Node types whose subtrees can never hold a method call or `new` expression:
+# type references, type/formal parameters and annotations (annotation values
+# are compile-time constants). The walker emits them but doesn't descend.
+# Literal and MemberReference are deliberately absent: their selectors can
+# carry calls ("abc".length(), arr[0].foo()).
+LEAF_TYPES = frozenset({
+    javalang.tree.BasicType,
+    javalang.tree.ReferenceType,
+    javalang.tree.TypeArgument,
+    javalang.tree.TypeParameter,
+    javalang.tree.Annotation,
+    javalang.tree.ElementValuePair,
+    javalang.tree.ElementArrayValue,
+    javalang.tree.FormalParameter,
+    javalang.tree.InferredFormalParameter,
+    javalang.tree.CatchClauseParameter,
+})
+
+
+# javalang's Node.children is a Python-level list comprehension of getattr()
+# calls, run once per visited node. One operator.attrgetter per node class
+# fetches the same values, in the same (cls.attrs) order, in a single C call.
+_CHILD_GETTERS: Dict[type, Callable[[Any], Tuple[Any, ...]]] = {}
+
+
+def _child_getter(cls: type) -> Callable[[Any], Tuple[Any, ...]]:
+    attrs = cls.attrs  # type: ignore[attr-defined]
+    getter: Callable[[Any], Tuple[Any, ...]]
+    if len(attrs) > 1:
+        getter = attrgetter(*attrs)
+    elif attrs:
+        single = attrgetter(attrs[0])
+        getter = lambda n: (single(n),)
+    else:
+        getter = lambda n: ()
+    _CHILD_GETTERS[cls] = getter
+    return getter
+
+
+def walk_ast_in_order(node: Any) -> List[Any]:
+    """
+    Pre-order traversal that returns nodes in a stable source-like order.
+    Iterative (explicit stack) so deep bodies don't pay a generator frame per node.
+    """
+    out: List[Any] = []
+    if not isinstance(node, Node):
+        return out
+    stack: List[Any] = [node]
+    while stack:
+        n = stack.pop()
+        out.append(n)
+        ncls = n.__class__
+        if ncls in LEAF_TYPES:
+            continue
+        getter = _CHILD_GETTERS.get(ncls)
+        if getter is None:
+            getter = _child_getter(ncls)
+        # only AST nodes are pushed, so every class has .attrs; plain
+        # attribute values (names, operators, modifier sets) can't hold calls
+        # push in reverse so the first child is popped (visited) first;
+        # Sequence rather than Tuple[Any, ...] keeps mypyc's reversed() happy
+        children: Sequence[Any] = getter(n)
+        for c in reversed(children):
+            cls = c.__class__
+            if cls is list or cls is tuple:
+                for item in reversed(c):
+                    if isinstance(item, Node):
+                        stack.append(item)
+            elif isinstance(c, Node):
+                stack.append(c)
+    return out
+
+
+def _calls_from_class_creator(n: Any, calls: CallList, order: int) -> int:
+    # new ClassName().method()
+    t = n.type
+    cname = t.name if t else ""
+    if cname:
+        for sel in n.selectors or ():
+            if isinstance(sel, javalang.tree.MethodInvocation):
+                calls.append(
+                    {
+                        "qualifier_kind": "new",
+                        "qualifier": cname,
+                        "member": sel.member or "",
+                        "order": order,
+                    }
+                )
+                order += 1
+    return order
+
+
+def _calls_from_method_invocation(n: Any, calls: CallList, order: int) -> int:
+    # obj.method() OR method()
+    q = n.qualifier or ""
+    kind = "none"
+    if q:
+        kind = "static" if q[:1].isupper() else "var"
+    calls.append(
+        {
+            "qualifier_kind": kind,
+            "qualifier": q,
+            "member": n.member or "",
+            "order": order,
+        }
+    )
+    return order + 1
+
+
+def _calls_from_super_invocation(n: Any, calls: CallList, order: int) -> int:
+    # super.method()
+    calls.append(
+        {
+            "qualifier_kind": "super",
+            "qualifier": "super",
+            "member": n.member or "",
+            "order": order,
+        }
+    )
+    return order + 1
+
+
+# exact javalang node type -> handler; none of these types are subclassed,
+# so one dict lookup per node replaces a chain of failed isinstance checks
+CALL_HANDLERS: Dict[type, Callable[[Any, CallList, int], int]] = {
+    javalang.tree.ClassCreator: _calls_from_class_creator,
+    javalang.tree.MethodInvocation: _calls_from_method_invocation,
+    javalang.tree.SuperMethodInvocation: _calls_from_super_invocation,
+}
+
+
+_SIMPLE_OPERAND_TYPES = (javalang.tree.MemberReference, javalang.tree.Literal, javalang.tree.This)
+
+
+def _is_simple_operand(e: Any) -> bool:
+    # name, this.name, 42 -- but not name.foo() or "s".length()
+    if e.__class__ not in _SIMPLE_OPERAND_TYPES:
+        return False
+    for sel in e.selectors or ():
+        if sel.__class__ is not javalang.tree.MemberReference or sel.selectors:
+            return False
+    return True
+
+
+def _is_trivial_statement(stmt: Any) -> bool:
+    """
+    Getter/setter-shaped statements that cannot contain a call:
+    `return;`, `return x;`, `return this.x;`, `this.x = x;`, `x = 1;`.
+    """
+    cls = stmt.__class__
+    if cls is javalang.tree.ReturnStatement:
+        return stmt.expression is None or _is_simple_operand(stmt.expression)
+    if cls is javalang.tree.StatementExpression:
+        e = stmt.expression
+        return (
+            e.__class__ is javalang.tree.Assignment
+            and _is_simple_operand(e.expressionl)
+            and _is_simple_operand(e.value)
+        )
+    return False
+
+
+def extract_ordered_calls(method_or_ctor: Any) -> CallList:
+    """
+    Extract ordered calls from a method/constructor body.
+
+    Returns list of:
+      {
+        "qualifier_kind": "none|super|static|new|var",
+        "qualifier": str,
+        "member": str,
+        "order": int
+      }
+    """
+    calls: CallList = []
+    body = method_or_ctor.body
+    if not body:
+        return calls
+
+    nodes = body if isinstance(body, list) else [body]
+    # plain getters/setters/field-assigning constructors: nothing to walk
+    if all(_is_trivial_statement(stmt) for stmt in nodes):
+        return calls
+
+    order = 0
+
+    for stmt in nodes:
+        for n in walk_ast_in_order(stmt):
+            handler = CALL_HANDLERS.get(type(n))
+            if handler is not None:
+                order = handler(n, calls, order)
+
+    return calls
@@ -1,8 +1,400 @@
 import os
+import sys
+import hashlib
+import multiprocessing
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from types import MappingProxyType
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field as dc_field
 import javalang  # type: ignore
-from typing import Dict, Any, List, Tuple
+from typing import DefaultDict, Dict, Any, List, Mapping, Tuple
 from cir.model import TypeDecl, Field, Method, Parameter
 from cir.graph import CIRGraph
+from adapters._java_walk import walk_ast_in_order, extract_ordered_calls
+
+# Parsed compilation units keyed by a hash of their source, so re-running a
+# project build only re-parses files whose content actually changed.
+# (path, mtime_ns, size) -> source hash lets unchanged files skip the read too.
+# A javalang tree is a few dozen times the size of its source, so the cap stays
+# small; CIR_AST_CACHE_MAX raises it (or 0 disables the cache).
+AST_CACHE_MAX = int(os.environ.get("CIR_AST_CACHE_MAX", "128"))
+_AST_CACHE: "OrderedDict[bytes, Any]" = OrderedDict()
+_FILE_DIGESTS: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+_AST_CACHE_LOCK = threading.Lock()
+
+
+def _source_digest(code: str) -> bytes:
+    return hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _remember(cache: OrderedDict, key, value) -> None:
+    if AST_CACHE_MAX <= 0:
+        return
+    with _AST_CACHE_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > AST_CACHE_MAX:
+            cache.popitem(last=False)
+
+
+def _clear_ast_cache() -> None:
+    """Drop every cached tree and file digest (tests, or after a javalang upgrade)."""
+    with _AST_CACHE_LOCK:
+        _AST_CACHE.clear()
+        _FILE_DIGESTS.clear()
+
+
+def _cached_ast(digest: bytes):
+    with _AST_CACHE_LOCK:
+        tree = _AST_CACHE.get(digest)
+        if tree is not None:
+            _AST_CACHE.move_to_end(digest)
+        return tree
+
+
+def _file_key(path: str) -> Tuple[str, int, int]:
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _read_source(path: str) -> str:
+    """
+    Read a whole source file as raw bytes and decode once, rather than going
+    through a text-mode file object's incremental decoder.
+    Invalid UTF-8 still raises (UnicodeDecodeError is a ValueError), so the
+    file is reported in parse_errors like any other unparsable unit.
+    """
+    return _read_bytes(path).decode("utf-8")
+
+
+def _read_bytes(path: str) -> bytes:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 64 * 1024))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _cached_file_ast(key: Tuple[str, int, int]):
+    with _AST_CACHE_LOCK:
+        digest = _FILE_DIGESTS.get(key)
+    return _cached_ast(digest) if digest is not None else None
+
+
+# Project builds fan per-file parsing out to worker processes (javalang is pure
+# Python, so threads wouldn't help). Small projects stay in-process: pool start-up
+# and result pickling would cost more than the parse itself.
+PARALLEL_MIN_FILES = 16
+_PARSE_POOL: ProcessPoolExecutor | None = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _init_parse_worker() -> None:
+    # Trees cached in a worker are never seen by the parent, which gets plain
+    # payloads back; keeping them would only multiply the cache by the pool size
+    global AST_CACHE_MAX
+    AST_CACHE_MAX = 0
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            # forkserver, not fork: the pool starts lazily inside a threaded
+            # server, and a forked child could inherit a lock (the AST cache's,
+            # sqlite's) that another thread held at that moment
+            _PARSE_POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_parse_worker,
+            )
+        return _PARSE_POOL
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    # A worker died (OOM, signal): drop the broken pool so the next build starts a fresh one
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Optional on-disk cache of per-file unit payloads (nodes, edges, type_nodes,
+# units), keyed by a hash of the source bytes. It survives restarts and also
+# hits for /parse/project, which writes every request to a fresh temp dir.
+# Bump UNIT_CACHE_VERSION whenever the payload shape or its content changes.
+UNIT_CACHE_VERSION = 3
+
+
+def _unit_cache_key(data: bytes) -> str:
+    return f"{UNIT_CACHE_VERSION}:{hashlib.sha256(data).hexdigest()}"
+
+
+# Reads and sha256 both release the GIL, so a project's worth of small sources
+# is keyed by a short-lived thread pool rather than one file after another.
+# On a single core the thread hand-offs cost more than they overlap.
+READ_THREADS = 32
+
+
+def _file_cache_key(path: str) -> str:
+    return _unit_cache_key(_read_bytes(path))
+
+
+def _file_cache_keys(paths: List[str]) -> List[str]:
+    if len(paths) < PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+        return [_file_cache_key(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(READ_THREADS, len(paths))) as io_pool:
+        return list(io_pool.map(_file_cache_key, paths))
+
+
+def _project_fingerprint(file_keys: List[str]) -> str:
+    # input order matters: it fixes node/edge order and which file wins a name clash
+    return hashlib.sha256("\n".join(file_keys).encode("ascii")).hexdigest()
+
+
+# Row caps for the on-disk cache; the least recently used rows go first.
+# Every distinct /parse/project upload adds a graph, so that table stays small.
+UNIT_CACHE_MAX_ROWS = 20000
+GRAPH_CACHE_MAX_ROWS = 200
+# Bump when the table layout changes; older files are dropped and rebuilt.
+_CACHE_SCHEMA_VERSION = 1
+
+
+class _UnitPayloadCache:
+    """
+    SQLite (WAL) store with two tables, both sha -> pickled blob:
+      cache:  per-file unit payloads, keyed by the file's content key
+      graphs: finished project graphs, keyed by the fingerprint of all file keys
+    Each row carries a last-used stamp, and each table is trimmed back to its
+    row cap (UNIT_CACHE_MAX_ROWS / GRAPH_CACHE_MAX_ROWS) after every write.
+    Only the building process writes.
+
+    Entries are unpickled on read, so the file must be trusted: keep it in a
+    directory only the server's user can write to.
+    """
+
+    _MAX_ROWS = {"cache": UNIT_CACHE_MAX_ROWS, "graphs": GRAPH_CACHE_MAX_ROWS}
+
+    def __init__(self, path: str) -> None:
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != _CACHE_SCHEMA_VERSION:
+                for table in self._MAX_ROWS:
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+                self._conn.execute(f"PRAGMA user_version={_CACHE_SCHEMA_VERSION}")
+            for table in self._MAX_ROWS:
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} "
+                    "(sha TEXT PRIMARY KEY, blob BLOB, used INTEGER NOT NULL)"
+                )
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_used ON {table} (used)")
+
+    def _load(self, table: str, key: str):
+        with self._lock:
+            with self._conn:
+                row = self._conn.execute(f"SELECT blob FROM {table} WHERE sha=?", (key,)).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        f"UPDATE {table} SET used=? WHERE sha=?", (time.time_ns(), key)
+                    )
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            # unreadable entry (e.g. written by an older adapter): treat as a miss
+            return None
+
+    def _store(self, table: str, items: List[Tuple[str, Any]]) -> None:
+        now = time.time_ns()
+        rows = [(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), now) for key, value in items]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} (sha, blob, used) VALUES (?, ?, ?)", rows
+                )
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE sha IN "
+                    f"(SELECT sha FROM {table} ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                    (self._MAX_ROWS[table],),
+                )
+
+    def get(self, key: str):
+        return self._load("cache", key)
+
+    def put_many(self, items: List[Tuple[str, Any]]) -> None:
+        self._store("cache", items)
+
+    def get_graph(self, fingerprint: str):
+        return self._load("graphs", fingerprint)
+
+    def put_graph(self, fingerprint: str, entry: Any) -> None:
+        self._store("graphs", [(fingerprint, entry)])
+
+
+# Modifier sets folded into one int: bits 0-2 pick the visibility (first match in
+# public > private > protected order), bits 3-5 are the static/abstract/final flags.
+_MOD_BITS = {"public": 1, "private": 2, "protected": 4, "static": 8, "abstract": 16, "final": 32}
+_VIS_BY_MASK = tuple(
+    "public" if m & 1 else "private" if m & 2 else "protected" if m & 4 else "package"
+    for m in range(8)
+)
+_FLAGS_BY_MASK = tuple((bool(m & 1), bool(m & 2), bool(m & 4)) for m in range(8))
+
+
+def _mods_to_mask(mods) -> int:
+    mask = 0
+    for m in mods:
+        mask |= _MOD_BITS.get(m, 0)
+    return mask
+
+
+# Everything a declaration needs from its modifier set, cached per distinct set:
+# (visibility, (is_static, is_abstract, is_final), modifiers tuple). Java only
+# ever produces a few dozen combinations, so after warm-up each declaration costs
+# one frozenset() and one dict hit. The tuple holds interned keywords -- the
+# tokenizer hands back a fresh "public"/"static"/... string per occurrence, and
+# sharing them keeps big graphs smaller and makes later comparisons pointer-cheap.
+# (Keyword and edge-label literals in this module are interned by the compiler.)
+# javalang hands modifiers over as a set, so the tuple is put in the JLS's
+# customary order rather than set order, which varies with the hash seed and
+# would make the same source serialize differently from run to run.
+ModifierInfo = Tuple[str, Tuple[bool, bool, bool], Tuple[str, ...]]
+_MODIFIER_ORDER = {
+    m: i for i, m in enumerate((
+        "public", "protected", "private", "abstract", "default", "static", "final",
+        "transient", "volatile", "synchronized", "native", "strictfp",
+    ))
+}
+_NO_MODIFIERS: ModifierInfo = (_VIS_BY_MASK[0], _FLAGS_BY_MASK[0], ())
+_MODIFIER_INFO: Dict[frozenset, ModifierInfo] = {}
+
+
+def _modifier_rank(m: str) -> Tuple[int, str]:
+    return (_MODIFIER_ORDER.get(m, len(_MODIFIER_ORDER)), m)
+
+
+def _modifier_info(mods) -> ModifierInfo:
+    if not mods:
+        return _NO_MODIFIERS
+    key = frozenset(mods)
+    info = _MODIFIER_INFO.get(key)
+    if info is None:
+        mask = _mods_to_mask(key)
+        info = _MODIFIER_INFO[key] = (
+            _VIS_BY_MASK[mask & 7],
+            _FLAGS_BY_MASK[(mask >> 3) & 7],
+            tuple(sys.intern(m) for m in sorted(key, key=_modifier_rank)),
+        )
+    return info
+
+
+# Shared attrs for the structural edges (HAS_FIELD/HAS_METHOD/PARAM_OF), which
+# carry none; CIRGraph.add_edges copies attrs into each edge's own data dict,
+# so one read-only mapping replaces a fresh {} per edge.
+_NO_EDGE_ATTRS: Mapping[str, Any] = MappingProxyType({})
+
+
+# declaration class -> CIR kind; _type_kind derives (and remembers) the kind for
+# any declaration class javalang adds later, e.g. "RecordDeclaration" -> "record"
+_KINDS: Dict[type, str] = {
+    javalang.tree.ClassDeclaration: "class",
+    javalang.tree.InterfaceDeclaration: "interface",
+    javalang.tree.EnumDeclaration: "enum",
+    javalang.tree.AnnotationDeclaration: "annotation",
+}
+
+
+def _type_kind(cls: type) -> str:
+    kind = _KINDS.get(cls)
+    if kind is None:
+        kind = _KINDS[cls] = sys.intern(cls.__name__.replace("Declaration", "").lower())
+    return kind
+
+
+# Declared supertypes per declaration class, as (extends, implements) names.
+# A class extends at most one type, an interface extends a list and implements
+# nothing, an enum only implements; annotation types have neither.
+def _class_supertypes(t) -> Tuple[List[str], List[str]]:
+    return (
+        [t.extends.name] if t.extends else [],
+        [i.name for i in t.implements] if t.implements else [],
+    )
+
+
+def _interface_supertypes(t) -> Tuple[List[str], List[str]]:
+    return ([e.name for e in t.extends] if t.extends else [], [])
+
+
+def _enum_supertypes(t) -> Tuple[List[str], List[str]]:
+    return ([], [i.name for i in t.implements] if t.implements else [])
+
+
+_SUPERTYPES = {
+    javalang.tree.ClassDeclaration: _class_supertypes,
+    javalang.tree.InterfaceDeclaration: _interface_supertypes,
+    javalang.tree.EnumDeclaration: _enum_supertypes,
+}
+
+
+# Per-type working records handed from _process_tree to _add_relationship_edges
+# (and back from pool workers). Slotted: smaller than dicts and attribute reads
+# are a slot load rather than a key lookup in the relationship pass.
+@dataclass(slots=True)
+class _FieldRec:
+    id: str
+    name: str
+    element_type: str
+    raw_type: str
+    multiplicity: str | None
+
+
+@dataclass(slots=True)
+class _ParamRec:
+    id: str
+    name: str
+    type_name: str
+
+
+@dataclass(slots=True)
+class _MethodRec:
+    id: str
+    name: str
+    return_type: str
+    params: List[_ParamRec]
+
+
+@dataclass(slots=True)
+class _UnitRec:
+    id: str
+    short_name: str
+    full_name: str
+    source_file: str | None = None
+    fields: List[_FieldRec] = dc_field(default_factory=list)
+    methods: List[_MethodRec] = dc_field(default_factory=list)
+    extends: List[str] = dc_field(default_factory=list)
+    implements: List[str] = dc_field(default_factory=list)
+    calls: List[Dict[str, Any]] = dc_field(default_factory=list)
 
 class JavaAdapter:
     """
@@ -23,32 +415,35 @@ class JavaAdapter:
       - Association multiplicity carried onto ASSOCIATES edges
       - Ordered call extraction for sequence diagrams
       - Skips invalid Java files during project parsing (collect errors)
+      - Optional persistent per-file cache (cache_path=SQLite file)
     """
 
     language = "java"
 
+    def __init__(self, cache_path: str | None = None) -> None:
+        self._unit_cache = _UnitPayloadCache(cache_path) if cache_path else None
+
     # ---------------- Helpers ----------------
 
-    COLLECTION_TYPES = {"List", "Set", "Collection", "Map"}
+    COLLECTION_TYPES = frozenset({"List", "Set", "Collection", "Map"})
 
-    def _visibility_from_mods(self, mods: set[str] | None) -> str:
-        mods = mods or set()
-        if "public" in mods:
-            return "public"
-        if "private" in mods:
-            return "private"
-        if "protected" in mods:
-            return "protected"
-        return "package"
+    # stateless helpers: no bound-method creation per call, and the collection
+    # set is a default arg so the lookup is a local rather than a class attribute
+    @staticmethod
+    def _visibility_from_mods(mods: set[str] | None) -> str:
+        return _modifier_info(mods)[0]
 
-    def _flags_from_mods(self, mods: set[str] | None) -> Tuple[bool, bool, bool]:
+    @staticmethod
+    def _flags_from_mods(mods: set[str] | None) -> Tuple[bool, bool, bool]:
         """
         Returns (is_static, is_abstract, is_final)
         """
-        mods = mods or set()
-        return ("static" in mods, "abstract" in mods, "final" in mods)
+        return _modifier_info(mods)[1]
 
-    def _resolve_type_name_and_multiplicity(self, t) -> Tuple[str, str, None | str]:
+    @staticmethod
+    def _resolve_type_name_and_multiplicity(
+        t, _collections: frozenset = COLLECTION_TYPES
+    ) -> Tuple[str, str, None | str]:
         """
         From a javalang Type node, derive:
           - logical_type (e.g. "Item")
@@ -59,141 +454,78 @@ class JavaAdapter:
         if t is None:
             return "void", "void", None
 
-        base_name = getattr(t, "name", "Object")
+        base_name = t.name
         raw_type = base_name
         multiplicity: None | str = None
         logical_type = base_name
 
         # generics: List<Item>, Set<Order>, Map<K,V>
-        args = getattr(t, "arguments", None)
+        # only ReferenceType carries type arguments; BasicType is just name + dims
+        try:
+            args = t.arguments
+        except AttributeError:
+            args = None
         if args:
-            try:
-                first_arg = args[0]
-                inner_type = getattr(first_arg, "type", first_arg)
-                inner_name = getattr(inner_type, "name", None)
-                if inner_name:
-                    logical_type = inner_name
-                    raw_type = f"{base_name}<{inner_name}>"
-                    multiplicity = "1..*"  # one-to-many
-            except Exception:
-                logical_type = base_name
-                raw_type = base_name
+            # TypeArgument wraps the element type; a bare `?` wildcard has none
+            inner_type = args[0].type
+            if inner_type is not None:
+                inner_name = inner_type.name
+                logical_type = inner_name
+                raw_type = f"{base_name}<{inner_name}>"
+                multiplicity = "1..*"  # one-to-many
 
         # arrays: Type[]
-        dims = getattr(t, "dimensions", None)
-        if dims:
+        if t.dimensions:
             multiplicity = multiplicity or "0..*"
             raw_type = f"{raw_type}[]"
 
-        # known collection type but no generic args
-        if base_name in self.COLLECTION_TYPES and multiplicity is None:
-            multiplicity = "0..*"
+        # known collection type but no generic args; otherwise a single value
+        if multiplicity is None:
+            multiplicity = "0..*" if base_name in _collections else "1"
 
-        # default multiplicity for single values
-        if multiplicity is None and base_name not in self.COLLECTION_TYPES:
-            multiplicity = "1"
-
-        return logical_type, raw_type, multiplicity
+        # type names end up as lookup keys during relationship resolution, and
+        # the same few raw types ("String", "List<Item>") repeat on every node
+        return sys.intern(logical_type), sys.intern(raw_type), multiplicity
 
     # ---------------- Call extraction ----------------
+    # (implemented in adapters/_java_walk.py so it can be mypyc-compiled)
 
-    def _walk_ast_in_order(self, node):
-        """
-        Pre-order traversal that yields nodes in a stable source-like order.
-        """
-        if node is None:
-            return
-        yield node
-        children = getattr(node, "children", None)
-        if not children:
-            return
-        for c in children:
-            if c is None:
-                continue
-            if isinstance(c, (list, tuple)):
-                for item in c:
-                    yield from self._walk_ast_in_order(item)
-            else:
-                yield from self._walk_ast_in_order(c)
+    def _walk_ast_in_order(self, node) -> List[Any]:
+        return walk_ast_in_order(node)
 
     def _extract_ordered_calls(self, method_or_ctor) -> List[Dict[str, Any]]:
-        """
-        Extract ordered calls from a method/constructor body.
-
-        Returns list of:
-          {
-            "qualifier_kind": "none|super|static|new|var",
-            "qualifier": str,
-            "member": str,
-            "order": int
-          }
-        """
-        calls: List[Dict[str, Any]] = []
-        body = getattr(method_or_ctor, "body", None)
-        if not body:
-            return calls
-
-        nodes = body if isinstance(body, list) else [body]
-        order = 0
-
-        for stmt in nodes:
-            for n in self._walk_ast_in_order(stmt):
-                # new ClassName().method()
-                if isinstance(n, javalang.tree.ClassCreator):
-                    t = getattr(n, "type", None)
-                    cname = getattr(t, "name", "") if t else ""
-                    if cname:
-                        for sel in getattr(n, "selectors", []) or []:
-                            if isinstance(sel, javalang.tree.MethodInvocation):
-                                calls.append(
-                                    {
-                                        "qualifier_kind": "new",
-                                        "qualifier": cname,
-                                        "member": sel.member or "",
-                                        "order": order,
-                                    }
-                                )
-                                order += 1
-
-                # obj.method() OR method()
-                if isinstance(n, javalang.tree.MethodInvocation):
-                    q = n.qualifier or ""
-                    kind = "none"
-                    if q:
-                        kind = "static" if q[:1].isupper() else "var"
-                    calls.append(
-                        {
-                            "qualifier_kind": kind,
-                            "qualifier": q,
-                            "member": n.member or "",
-                            "order": order,
-                        }
-                    )
-                    order += 1
-
-                # super.method()
-                if isinstance(n, javalang.tree.SuperMethodInvocation):
-                    calls.append(
-                        {
-                            "qualifier_kind": "super",
-                            "qualifier": "super",
-                            "member": n.member or "",
-                            "order": order,
-                        }
-                    )
-                    order += 1
-
-        return calls
+        return extract_ordered_calls(method_or_ctor)
 
     # ---------------- Parsing entry points ----------------
 
     def parse_to_ast(self, code: str):
+        digest = _source_digest(code)
+        tree = _cached_ast(digest)
+        if tree is not None:
+            return tree
         try:
-            return javalang.parse.parse(code)
+            tree = javalang.parse.parse(code)
         except javalang.parser.JavaSyntaxError as e:
             raise ValueError(f"Java syntax error: {e}")
         except Exception as e:
             raise ValueError(f"Failed to parse Java code: {e}")
+        _remember(_AST_CACHE, digest, tree)
+        return tree
+
+    def _parse_file(self, path: str):
+        """
+        Parse one source file, skipping both the read and the parse when the
+        file's (mtime, size) and content hash are already known.
+        """
+        key = _file_key(path)
+        tree = _cached_file_ast(key)
+        if tree is not None:
+            return tree
+
+        code = _read_source(path)
+        tree = self.parse_to_ast(code)
+        _remember(_FILE_DIGESTS, key, _source_digest(code))
+        return tree
 
     def build_cir_graph_for_code(self, code: str, filename: str | None = None) -> CIRGraph:
         """
@@ -201,7 +533,7 @@ class JavaAdapter:
         """
         graph = CIRGraph()
         type_nodes: Dict[str, str] = {}
-        units: List[Dict[str, Any]] = []
+        units: List[_UnitRec] = []
 
         self._process_compilation_unit(code, graph, type_nodes, units, source_file=filename)
         self._add_relationship_edges(graph, type_nodes, units)
@@ -214,21 +546,109 @@ class JavaAdapter:
         """
         graph = CIRGraph()
         type_nodes: Dict[str, str] = {}
-        units: List[Dict[str, Any]] = []
+        units: List[_UnitRec] = []
 
         errors: List[Dict[str, str]] = []
 
-        for path in files:
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    code = f.read()
-                self._process_compilation_unit(code, graph, type_nodes, units, source_file=path)
-            except ValueError as e:
-                errors.append({"file": path, "error": str(e)})
-                continue
+        ncpu = os.cpu_count() or 1
+        use_pool = len(files) >= PARALLEL_MIN_FILES and ncpu >= 2
+        cache = self._unit_cache
+
+        # With a cache, an unchanged project (same contents in the same order)
+        # comes back as the finished graph; only the error paths are re-attached.
+        cache_keys: List[str] | None = None
+        fingerprint: str | None = None
+        if cache is not None:
+            cache_keys = _file_cache_keys(files)
+            fingerprint = _project_fingerprint(cache_keys)
+            hit = cache.get_graph(fingerprint)
+            if hit is not None:
+                cached_graph, cached_errors = hit
+                cached_graph.g.graph["parse_errors"] = [
+                    {"file": files[i], "error": msg} for i, msg in cached_errors
+                ]
+                return cached_graph
+
+        error_at: List[Tuple[int, str]] = []
+        if cache is None and not use_pool:
+            for path in files:
+                try:
+                    tree = self._parse_file(path)
+                    self._process_tree(tree, graph, type_nodes, units, source_file=path)
+                except ValueError as e:
+                    errors.append({"file": path, "error": str(e)})
+                    continue
+        else:
+            # Files this process already holds a tree for (or every file, below the
+            # pool threshold) are handled locally; the rest are parsed in the pool.
+            # Payloads are merged back in input order so the graph comes out
+            # exactly as the serial loop would build it.
+            # With a unit cache, files whose content hash is stored skip parsing
+            # entirely and the misses are written back once the build is done.
+            results: List[Any] = [None] * len(files)
+            pending: List[int] = []
+            miss_keys: Dict[int, str] = {}
+            for i, path in enumerate(files):
+                if cache is not None and cache_keys is not None:
+                    key = cache_keys[i]
+                    payload = cache.get(key)
+                    if payload is not None:
+                        for unit in payload[3]:
+                            unit.source_file = path
+                        results[i] = (payload, None)
+                        continue
+                    miss_keys[i] = key
+                if not use_pool or _cached_file_ast(_file_key(path)) is not None:
+                    results[i] = _parse_file_to_unit_payload(path)
+                else:
+                    pending.append(i)
+
+            if pending:
+                chunksize = max(1, len(pending) // (4 * ncpu))
+                pool = _get_parse_pool()
+                try:
+                    parsed = pool.map(
+                        _parse_file_to_unit_payload,
+                        [files[i] for i in pending],
+                        chunksize=chunksize,
+                    )
+                    for i, res in zip(pending, parsed):
+                        results[i] = res
+                except BrokenProcessPool:
+                    _discard_parse_pool(pool)
+                    for i in pending:
+                        if results[i] is None:
+                            results[i] = _parse_file_to_unit_payload(files[i])
+
+            if cache is not None and miss_keys:
+                cache.put_many(
+                    [(key, results[i][0]) for i, key in miss_keys.items() if results[i][1] is None]
+                )
+
+            # every file's nodes, then every file's edges, each in one networkx
+            # call; per-file edges only touch that file's own nodes, so the
+            # node and edge order match the file-by-file merge
+            node_lists: List[Any] = []
+            edge_lists: List[Any] = []
+            for i, (path, (payload, error)) in enumerate(zip(files, results)):
+                if error is not None:
+                    errors.append({"file": path, "error": error})
+                    error_at.append((i, error))
+                    continue
+                nodes, edges, unit_type_nodes, unit_list = payload
+                node_lists.append(nodes)
+                edge_lists.append(edges)
+                type_nodes.update(unit_type_nodes)
+                units.extend(unit_list)
+            graph.g.add_nodes_from(chain.from_iterable(node_lists))
+            graph.g.add_edges_from(chain.from_iterable(edge_lists))
 
         self._add_relationship_edges(graph, type_nodes, units)
 
+        if cache is not None and fingerprint is not None:
+            # stored before parse_errors is attached: error paths belong to this call
+            cache.put_graph(fingerprint, (graph, error_at))
+
         # attach errors so API can return them
         graph.g.graph["parse_errors"] = errors
 
@@ -241,20 +661,44 @@ class JavaAdapter:
         code: str,
         graph: CIRGraph,
         type_nodes: Dict[str, str],
-        units: List[Dict[str, Any]],
+        units: List[_UnitRec],
         source_file: str | None = None,
     ) -> None:
         tree = self.parse_to_ast(code)
-        package_name = getattr(getattr(tree, "package", None), "name", None)
+        self._process_tree(tree, graph, type_nodes, units, source_file=source_file)
 
-        for t in tree.types:
-            short_name = t.name
-            full_name = f"{package_name}.{short_name}" if package_name else short_name
+    def _process_tree(
+        self,
+        tree,
+        graph: CIRGraph,
+        type_nodes: Dict[str, str],
+        units: List[_UnitRec],
+        source_file: str | None = None,
+    ) -> None:
+        package_name = tree.package.name if tree.package else None
+        if package_name:
+            package_name = sys.intern(package_name)
 
-            type_id = f"type:{full_name}"
-            kind = type(t).__name__.replace("Declaration", "").lower()
-            visibility = self._visibility_from_mods(t.modifiers or set())
-            _, is_abstract, is_final = self._flags_from_mods(t.modifiers or set())
+        # collected for the whole compilation unit and added in two bulk calls
+        nodes_batch: List[Tuple[str, str, Any]] = []
+        edges_batch: List[Tuple[str, str, str, Mapping[str, Any]]] = []
+        add_node = nodes_batch.append
+        add_edge = edges_batch.append
+        resolve_type = self._resolve_type_name_and_multiplicity
+
+        for t in tree.types:
+            short_name = sys.intern(t.name)
+            full_name = sys.intern(f"{package_name}.{short_name}" if package_name else short_name)
+
+            type_id = "type:" + full_name
+            # member ids share these per-type prefixes instead of re-formatting full_name
+            field_prefix = "field:" + full_name + ":"
+            method_prefix = "method:" + full_name + ":"
+            ctor_prefix = "ctor:" + full_name + ":"
+            param_prefix = "param:" + full_name + ":"
+            t_cls = type(t)
+            kind = _KINDS.get(t_cls) or _type_kind(t_cls)
+            visibility, (_, is_abstract, is_final), modifiers = _modifier_info(t.modifiers)
 
             type_decl = TypeDecl(
                 id=type_id,
@@ -262,45 +706,30 @@ class JavaAdapter:
                 kind=kind,
                 visibility=visibility,
                 package=package_name,
-                modifiers=tuple(t.modifiers or []),
+                modifiers=modifiers,
                 is_abstract=is_abstract,
                 is_final=is_final,
             )
-            graph.add_node(type_id, "TypeDecl", type_decl)
+            add_node((type_id, "TypeDecl", type_decl))
             type_nodes[full_name] = type_id
 
-            unit: Dict[str, Any] = {
-                "id": type_id,
-                "short_name": short_name,
-                "full_name": full_name,
-                "fields": [],
-                "methods": [],
-                "extends": [],
-                "implements": [],
-                "calls": [],
-                "source_file": source_file,
-            }
-
-            if hasattr(t, "extends") and t.extends:
-                try:
-                    if hasattr(t.extends, "name"):
-                        names = [t.extends.name]
-                    else:
-                        names = [e.name for e in t.extends]
-                except Exception:
-                    names = []
-                unit["extends"] = names
+            unit = _UnitRec(
+                id=type_id,
+                short_name=short_name,
+                full_name=full_name,
+                source_file=source_file,
+            )
 
-            if hasattr(t, "implements") and t.implements:
-                unit["implements"] = [i.name for i in t.implements]
+            supertypes = _SUPERTYPES.get(t_cls)
+            if supertypes is not None:
+                unit.extends, unit.implements = supertypes(t)
 
             # ---------- fields ----------
-            for field in getattr(t, "fields", []):
-                logical_type, raw_type, multiplicity = self._resolve_type_name_and_multiplicity(field.type)
+            for field in t.fields:
+                logical_type, raw_type, multiplicity = resolve_type(field.type)
+                visibility_f, _, modifiers_f = _modifier_info(field.modifiers)
                 for decl in field.declarators:
-                    field_id = f"field:{full_name}:{decl.name}"
-                    visibility_f = self._visibility_from_mods(field.modifiers or set())
-                    mods_f = field.modifiers or set()
+                    field_id = field_prefix + decl.name
 
                     field_node = Field(
                         id=field_id,
@@ -308,30 +737,29 @@ class JavaAdapter:
                         type_name=logical_type,
                         raw_type=raw_type,
                         visibility=visibility_f,
-                        modifiers=tuple(mods_f),
+                        modifiers=modifiers_f,
                         multiplicity=multiplicity,
                     )
-                    graph.add_node(field_id, "Field", field_node)
-                    graph.add_edge(type_id, field_id, "HAS_FIELD")
-
-                    unit["fields"].append(
-                        {
-                            "id": field_id,
-                            "name": decl.name,
-                            "element_type": logical_type,
-                            "raw_type": raw_type,
-                            "multiplicity": multiplicity,
-                        }
+                    add_node((field_id, "Field", field_node))
+                    add_edge((type_id, field_id, "HAS_FIELD", _NO_EDGE_ATTRS))
+
+                    unit.fields.append(
+                        _FieldRec(
+                            id=field_id,
+                            name=decl.name,
+                            element_type=logical_type,
+                            raw_type=raw_type,
+                            multiplicity=multiplicity,
+                        )
                     )
 
             # ---------- methods ----------
-            for method in getattr(t, "methods", []):
-                method_id = f"method:{full_name}:{method.name}"
-                visibility_m = self._visibility_from_mods(method.modifiers or set())
-                mods_m = method.modifiers or set()
-                is_static, is_abs, is_final_m = self._flags_from_mods(mods_m)
+            for method in t.methods:
+                method_id = method_prefix + method.name
+                method_param_prefix = param_prefix + method.name + ":"
+                visibility_m, (is_static, is_abs, is_final_m), modifiers_m = _modifier_info(method.modifiers)
 
-                logical_ret, raw_ret, _ = self._resolve_type_name_and_multiplicity(method.return_type)
+                logical_ret, raw_ret, _ = resolve_type(method.return_type)
 
                 method_node = Method(
                     id=method_id,
@@ -339,48 +767,42 @@ class JavaAdapter:
                     return_type=logical_ret,
                     raw_return_type=raw_ret,
                     visibility=visibility_m,
-                    modifiers=tuple(mods_m),
+                    modifiers=modifiers_m,
                     is_constructor=False,
                     is_static=is_static,
                     is_abstract=is_abs,
                     is_final=is_final_m,
                 )
-                graph.add_node(method_id, "Method", method_node)
-                graph.add_edge(type_id, method_id, "HAS_METHOD")
+                add_node((method_id, "Method", method_node))
+                add_edge((type_id, method_id, "HAS_METHOD", _NO_EDGE_ATTRS))
 
-                param_infos: List[Dict[str, Any]] = []
+                param_infos: List[_ParamRec] = []
                 for p in method.parameters:
-                    p_id = f"param:{full_name}:{method.name}:{p.name}"
-                    logical, raw, _ = self._resolve_type_name_and_multiplicity(p.type)
+                    p_id = method_param_prefix + p.name
+                    logical, raw, _ = resolve_type(p.type)
                     param_node = Parameter(
                         id=p_id,
                         name=p.name,
                         type_name=logical,
                         raw_type=raw,
                     )
-                    graph.add_node(p_id, "Parameter", param_node)
-                    graph.add_edge(p_id, method_id, "PARAM_OF")
-                    param_infos.append({"id": p_id, "name": p.name, "type_name": logical})
+                    add_node((p_id, "Parameter", param_node))
+                    add_edge((p_id, method_id, "PARAM_OF", _NO_EDGE_ATTRS))
+                    param_infos.append(_ParamRec(id=p_id, name=p.name, type_name=logical))
 
                 extracted = self._extract_ordered_calls(method)
                 for c in extracted:
-                    unit["calls"].append({"src_method_id": method_id, **c})
-
-                unit["methods"].append(
-                    {
-                        "id": method_id,
-                        "name": method.name,
-                        "return_type": logical_ret,
-                        "params": param_infos,
-                    }
+                    unit.calls.append({"src_method_id": method_id, **c})
+
+                unit.methods.append(
+                    _MethodRec(id=method_id, name=method.name, return_type=logical_ret, params=param_infos)
                 )
 
             # ---------- constructors ----------
-            for ctor in getattr(t, "constructors", []):
-                ctor_id = f"ctor:{full_name}:{ctor.name}"
-                visibility_c = self._visibility_from_mods(ctor.modifiers or set())
-                mods_c = ctor.modifiers or set()
-                is_static, is_abs, is_final_c = self._flags_from_mods(mods_c)
+            for ctor in t.constructors:
+                ctor_id = ctor_prefix + ctor.name
+                ctor_param_prefix = param_prefix + ctor.name + ":"
+                visibility_c, (is_static, is_abs, is_final_c), modifiers_c = _modifier_info(ctor.modifiers)
 
                 method_node = Method(
                     id=ctor_id,
@@ -388,163 +810,174 @@ class JavaAdapter:
                     return_type="void",
                     raw_return_type="<constructor>",
                     visibility=visibility_c,
-                    modifiers=tuple(mods_c),
+                    modifiers=modifiers_c,
                     is_constructor=True,
                     is_static=is_static,
                     is_abstract=is_abs,
                     is_final=is_final_c,
                 )
-                graph.add_node(ctor_id, "Method", method_node)
-                graph.add_edge(type_id, ctor_id, "HAS_METHOD")
+                add_node((ctor_id, "Method", method_node))
+                add_edge((type_id, ctor_id, "HAS_METHOD", _NO_EDGE_ATTRS))
 
-                param_infos: List[Dict[str, Any]] = []
+                param_infos: List[_ParamRec] = []
                 for p in ctor.parameters:
-                    p_id = f"param:{full_name}:{ctor.name}:{p.name}"
-                    logical, raw, _ = self._resolve_type_name_and_multiplicity(p.type)
+                    p_id = ctor_param_prefix + p.name
+                    logical, raw, _ = resolve_type(p.type)
                     param_node = Parameter(
                         id=p_id,
                         name=p.name,
                         type_name=logical,
                         raw_type=raw,
                     )
-                    graph.add_node(p_id, "Parameter", param_node)
-                    graph.add_edge(p_id, ctor_id, "PARAM_OF")
-                    param_infos.append({"id": p_id, "name": p.name, "type_name": logical})
+                    add_node((p_id, "Parameter", param_node))
+                    add_edge((p_id, ctor_id, "PARAM_OF", _NO_EDGE_ATTRS))
+                    param_infos.append(_ParamRec(id=p_id, name=p.name, type_name=logical))
 
                 extracted = self._extract_ordered_calls(ctor)
                 for c in extracted:
-                    unit["calls"].append({"src_method_id": ctor_id, **c})
-
-                unit["methods"].append(
-                    {
-                        "id": ctor_id,
-                        "name": ctor.name,
-                        "return_type": "void",
-                        "params": param_infos,
-                    }
+                    unit.calls.append({"src_method_id": ctor_id, **c})
+
+                unit.methods.append(
+                    _MethodRec(id=ctor_id, name=ctor.name, return_type="void", params=param_infos)
                 )
 
             units.append(unit)
 
+        graph.add_nodes(nodes_batch)
+        graph.add_edges(edges_batch)
+
     def _add_relationship_edges(
         self,
         graph: CIRGraph,
         type_nodes: Dict[str, str],
-        units: List[Dict[str, Any]],
+        units: List[_UnitRec],
     ) -> None:
-        # full name -> type node id
-        full_to_id: Dict[str, str] = dict(type_nodes)
-
-        # short name -> list of candidate ids
-        short_to_ids: Dict[str, List[str]] = {}
-        # type id -> full name
-        id_to_full: Dict[str, str] = {}
+        # One lookup table for every unambiguous name: each short name that only
+        # one type uses, overlaid with all full names (a full name wins over an
+        # equal short name). Only short names shared by several packages need
+        # the caller's package, via short name -> {package: type id}.
+        id_to_pkg: Dict[str, str] = {}
+        short_to_pkg_map: DefaultDict[str, Dict[str, str]] = defaultdict(dict)
 
         for full_name, nid in type_nodes.items():
-            id_to_full[nid] = full_name
-            short_name = full_name.split(".")[-1]
-            short_to_ids.setdefault(short_name, []).append(nid)
-
-        def _pkg(full_name: str) -> str:
-            parts = full_name.split(".")
-            return ".".join(parts[:-1]) if len(parts) > 1 else ""
-
-        def resolve_type_name(tname: str, src_id: str) -> str | None:
-            if tname in full_to_id:
-                return full_to_id[tname]
-
-            candidates = short_to_ids.get(tname)
-            if not candidates:
-                return None
-            if len(candidates) == 1:
-                return candidates[0]
-
-            src_full = id_to_full.get(src_id, "")
-            src_pkg = _pkg(src_full)
-
-            same_pkg = []
-            for cid in candidates:
-                c_full = id_to_full.get(cid, "")
-                if _pkg(c_full) == src_pkg:
-                    same_pkg.append(cid)
-
-            if len(same_pkg) == 1:
-                return same_pkg[0]
-
-            return None
-
-        # method lookup: (type_id, method_name) -> method_id
+            pkg, _, short_name = full_name.rpartition(".")
+            id_to_pkg[nid] = pkg
+            short_to_pkg_map[short_name][pkg] = nid
+
+        direct_ids: Dict[str, str] = {}
+        ambiguous: Dict[str, Dict[str, str]] = {}
+        for short_name, by_pkg in short_to_pkg_map.items():
+            if len(by_pkg) == 1:
+                direct_ids[short_name] = next(iter(by_pkg.values()))
+            else:
+                ambiguous[short_name] = by_pkg
+        direct_ids.update(type_nodes)
+
+        direct_get = direct_ids.get
+        ambiguous_get = ambiguous.get
+
+        def resolve_type_name(tname: str, src_pkg: str) -> str | None:
+            target = direct_get(tname)
+            if target is None:
+                by_pkg = ambiguous_get(tname)
+                if by_pkg is not None:
+                    # ambiguous short name: prefer the candidate in the caller's package
+                    target = by_pkg.get(src_pkg)
+            return target
+
+        # Structural edges (INHERITS/IMPLEMENTS/ASSOCIATES/DEPENDS_ON) are emitted
+        # once per (src, dst, type[, multiplicity]); every extra param or return of
+        # the same type would otherwise add another identical multi-edge.
+        # CALLS stay one edge per call site since each carries its own order.
+        # All relationship edges are collected and added in one bulk call at the end.
+        seen_edges: set[tuple] = set()
+        edges_batch: List[Tuple[str, str, str, Mapping[str, Any]]] = []
+
+        def add_edge_once(src: str, dst: str, etype: str, **attrs) -> None:
+            key = (src, dst, etype, *attrs.values())
+            if key in seen_edges:
+                return
+            seen_edges.add(key)
+            edges_batch.append((src, dst, etype, attrs))
+
+        # One pass over all units builds every lookup the CALLS resolution needs:
+        #   method lookup: (type_id, method_name) -> method_id
+        #   per unit (aligned with `units`): field name -> type, (method id, param) -> type
+        # Param types sit in one flat map per unit rather than a dict per method.
         method_index: Dict[tuple[str, str], str] = {}
+        unit_indexes: List[Tuple[Dict[str, str], Dict[tuple[str, str], str]]] = []
         for u in units:
-            owner_type_id = u["id"]
-            for m in u.get("methods", []):
-                mid = m.get("id")
-                mname = m.get("name")
+            owner_type_id = u.id
+
+            field_type_by_name: Dict[str, str] = {}
+            for f in u.fields:
+                fname = f.name
+                ftype = f.element_type
+                if fname and ftype:
+                    field_type_by_name[fname] = ftype
+
+            param_type_by_key: Dict[tuple[str, str], str] = {}
+            for m in u.methods:
+                mid = m.id
+                mname = m.name
                 if mid and mname:
                     method_index[(owner_type_id, mname)] = mid
+                if not mid:
+                    continue
+                for p in m.params:
+                    pname = p.name
+                    ptype = p.type_name
+                    if pname and ptype:
+                        param_type_by_key[(mid, pname)] = ptype
 
-        for u in units:
-            src_id = u["id"]
+            unit_indexes.append((field_type_by_name, param_type_by_key))
+
+        for u, (field_type_by_name, param_type_by_key) in zip(units, unit_indexes):
+            src_id = u.id
+            src_pkg = id_to_pkg.get(src_id, "")
 
             # ---------- INHERITS / IMPLEMENTS ----------
-            for base in u.get("extends", []):
-                target = resolve_type_name(base, src_id)
+            for base in u.extends:
+                target = resolve_type_name(base, src_pkg)
                 if target and target != src_id:
-                    graph.add_edge(src_id, target, "INHERITS")
+                    add_edge_once(src_id, target, "INHERITS")
 
-            for iface in u.get("implements", []):
-                target = resolve_type_name(iface, src_id)
+            for iface in u.implements:
+                target = resolve_type_name(iface, src_pkg)
                 if target and target != src_id:
-                    graph.add_edge(src_id, target, "IMPLEMENTS")
+                    add_edge_once(src_id, target, "IMPLEMENTS")
 
             # ---------- ASSOCIATES ----------
-            for f in u.get("fields", []):
-                tname = f.get("element_type")
-                mult = f.get("multiplicity")
-                if not tname:
-                    continue
-                target = resolve_type_name(tname, src_id)
+            # fields sharing a type and multiplicity (several `Item` fields) map
+            # to one edge, so resolve each distinct pair once
+            assoc_keys: Dict[Tuple[str, str | None], None] = {}
+            for f in u.fields:
+                if f.element_type:
+                    assoc_keys[(f.element_type, f.multiplicity)] = None
+
+            for tname, mult in assoc_keys:
+                target = resolve_type_name(tname, src_pkg)
                 if target and target != src_id:
-                    graph.add_edge(src_id, target, "ASSOCIATES", multiplicity=mult)
+                    add_edge_once(src_id, target, "ASSOCIATES", multiplicity=mult)
 
             # ---------- DEPENDS_ON ----------
-            for m in u.get("methods", []):
-                for p in m.get("params", []):
-                    tname = p.get("type_name")
-                    if not tname:
-                        continue
-                    target = resolve_type_name(tname, src_id)
-                    if target and target != src_id:
-                        graph.add_edge(src_id, target, "DEPENDS_ON")
-
-                rtype = m.get("return_type")
-                if rtype:
-                    target = resolve_type_name(rtype, src_id)
-                    if target and target != src_id:
-                        graph.add_edge(src_id, target, "DEPENDS_ON")
+            # unique param/return type names for the whole unit (first-seen order),
+            # resolved and emitted once each instead of once per mention
+            dep_names: Dict[str, None] = {}
+            for m in u.methods:
+                for p in m.params:
+                    if p.type_name:
+                        dep_names[p.type_name] = None
+                if m.return_type:
+                    dep_names[m.return_type] = None
+
+            for tname in dep_names:
+                target = resolve_type_name(tname, src_pkg)
+                if target and target != src_id:
+                    add_edge_once(src_id, target, "DEPENDS_ON")
 
             # ---------- CALLS ----------
-            field_type_by_name: Dict[str, str] = {}
-            for f in u.get("fields", []):
-                fname = f.get("name")
-                ftype = f.get("element_type")
-                if fname and ftype:
-                    field_type_by_name[fname] = ftype
-
-            method_param_types: Dict[str, Dict[str, str]] = {}
-            for m in u.get("methods", []):
-                mid = m.get("id")
-                if not mid:
-                    continue
-                pm: Dict[str, str] = {}
-                for p in m.get("params", []):
-                    pname = p.get("name")
-                    ptype = p.get("type_name")
-                    if pname and ptype:
-                        pm[pname] = ptype
-                method_param_types[mid] = pm
-
-            for c in u.get("calls", []):
+            for c in u.calls:
                 src_method_id = c.get("src_method_id")
                 qkind = c.get("qualifier_kind")
                 qual = (c.get("qualifier") or "").strip()
@@ -560,7 +993,7 @@ class JavaAdapter:
                     target_type_id = src_id
 
                 elif qkind in ("static", "new"):
-                    tid = resolve_type_name(qual, src_id)
+                    tid = resolve_type_name(qual, src_pkg)
                     if not tid:
                         continue
                     target_type_id = tid
@@ -568,10 +1001,10 @@ class JavaAdapter:
                 elif qkind == "var":
                     var_type = field_type_by_name.get(qual)
                     if not var_type:
-                        var_type = method_param_types.get(src_method_id, {}).get(qual)
+                        var_type = param_type_by_key.get((src_method_id, qual))
                     if not var_type:
                         continue
-                    tid = resolve_type_name(var_type, src_id)
+                    tid = resolve_type_name(var_type, src_pkg)
                     if not tid:
                         continue
                     target_type_id = tid
@@ -580,4 +1013,30 @@ class JavaAdapter:
                 if not dst_method_id:
                     continue
 
-                graph.add_edge(src_method_id, dst_method_id, "CALLS", order=order)
+                edges_batch.append((src_method_id, dst_method_id, "CALLS", {"order": order}))
+
+        graph.add_edges(edges_batch)
+
+
+def _parse_file_to_unit_payload(path: str) -> Tuple[Any, str | None]:
+    """
+    Process-pool entry point: parse one file into plain node/edge/unit data
+    (nodes, edges, type_nodes, units) that the parent merges into its graph.
+    Returns (payload, None) on success or (None, error message) for invalid Java.
+    """
+    adapter = JavaAdapter()
+    graph = CIRGraph()
+    type_nodes: Dict[str, str] = {}
+    units: List[_UnitRec] = []
+    try:
+        tree = adapter._parse_file(path)
+        adapter._process_tree(tree, graph, type_nodes, units, source_file=path)
+    except ValueError as e:
+        return None, str(e)
+    payload = (
+        list(graph.g.nodes(data=True)),
+        list(graph.g.edges(data=True)),
+        type_nodes,
+        units,
+    )
+    return payload, None
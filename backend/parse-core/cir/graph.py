@@ -1,5 +1,22 @@
 import networkx as nx # type: ignore
-from typing import Any, Dict
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+# payload class -> its dataclass field names; the CIR model classes use
+# __slots__, so their attributes can't be read off __dict__
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _payload_attrs(payload: Any) -> Dict[str, Any]:
+    cls = type(payload)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        if not is_dataclass(payload):
+            if hasattr(payload, "__dict__"):
+                return dict(payload.__dict__)
+            return dict(payload) if isinstance(payload, dict) else {}
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(payload))
+    return {name: getattr(payload, name) for name in names}
 
 class CIRGraph:
     """
@@ -17,6 +34,22 @@ class CIRGraph:
     def add_edge(self, src: str, dst: str, etype: str, **attrs) -> None:
         self.g.add_edge(src, dst, etype=etype, **attrs)
 
+    def add_nodes(self, nodes: Iterable[Tuple[str, str, Any]]) -> None:
+        """
+        Bulk add_node: (node_id, kind, payload) triples in one networkx call.
+        """
+        self.g.add_nodes_from(
+            (node_id, {"kind": kind, "payload": payload}) for node_id, kind, payload in nodes
+        )
+
+    def add_edges(self, edges: Iterable[Tuple[str, str, str, Mapping[str, Any]]]) -> None:
+        """
+        Bulk add_edge: (src, dst, etype, attrs) tuples in one networkx call.
+        """
+        self.g.add_edges_from(
+            (src, dst, {"etype": etype, **attrs}) for src, dst, etype, attrs in edges
+        )
+
     def to_debug_json(self) -> Dict[str, Any]:
         """
         Convert graph to JSON-like dict for debugging / API responses.
@@ -24,15 +57,10 @@ class CIRGraph:
         """
         nodes = []
         for node_id, data in self.g.nodes(data=True):
-            payload = data.get("payload")
-            if hasattr(payload, "__dict__"):
-                attrs = dict(payload.__dict__)
-            else:
-                attrs = dict(payload) if isinstance(payload, dict) else {}
             nodes.append({
                 "id": node_id,
                 "kind": data.get("kind"),
-                "attrs": attrs,
+                "attrs": _payload_attrs(data.get("payload")),
             })
 
         edges = []
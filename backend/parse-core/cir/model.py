@@ -3,7 +3,7 @@ from typing import Literal, Optional, Tuple
 
 Visibility = Literal["public", "protected", "private", "package"]
 
-@dataclass
+@dataclass(slots=True)
 class TypeDecl:
     id: str
     name: str
@@ -14,7 +14,7 @@ class TypeDecl:
     is_abstract: bool = False
     is_final: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Field:
     id: str
     name: str
@@ -24,7 +24,7 @@ class Field:
     modifiers: Tuple[str, ...] = ()
     multiplicity: Optional[str] = None  # e.g. "1", "0..*", "1..*"
 
-@dataclass
+@dataclass(slots=True)
 class Method:
     id: str
     name: str
@@ -37,7 +37,7 @@ class Method:
     is_abstract: bool = False
     is_final: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     id: str
     name: str
@@ -36,8 +36,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Pre-instantiate adapters (they are stateless/reusable)
-_java_adapter = JavaAdapter()
+# Pre-instantiate adapters (they are stateless/reusable).
+# Parsed Java units are cached on disk by content hash, by default in the user
+# cache dir so it doesn't depend on where the server was started from.
+# Set CIR_CACHE_PATH to move it, or to "" to turn the cache off. Entries are
+# pickles, so only point it somewhere no other user can write to.
+_DEFAULT_CIR_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "parse-core",
+    "java_units.sqlite",
+)
+_java_adapter = JavaAdapter(cache_path=os.environ.get("CIR_CACHE_PATH", _DEFAULT_CIR_CACHE) or None)
 _python_adapter = PythonAdapter()
 
 _SUPPORTED_LANGUAGES = {"java", "python"}
@@ -33,3 +33,25 @@ def test_inheritance_and_implements():
 
     assert (vip_id, base_id, "INHERITS") in edges
     assert (base_id, icust_id, "IMPLEMENTS") in edges
+
+def test_parse_to_ast_reuses_tree_for_identical_source():
+    from adapters.java_adapter import _clear_ast_cache
+
+    code = "class A { void f() { g(); } void g() {} }"
+    adapter = JavaAdapter()
+    _clear_ast_cache()
+
+    first = adapter.parse_to_ast(code)
+    assert adapter.parse_to_ast(code) is first
+
+    _clear_ast_cache()
+    assert adapter.parse_to_ast(code) is not first
+
+
+def test_modifiers_are_in_canonical_order():
+    code = "public abstract class A { static final public int X = 1; }"
+    data = JavaAdapter().build_cir_graph_for_code(code).to_debug_json()
+    nodes = {n["id"]: n["attrs"] for n in data["nodes"]}
+
+    assert nodes["type:A"]["modifiers"] == ("public", "abstract")
+    assert nodes["field:A:X"]["modifiers"] == ("public", "static", "final")
@@ -45,3 +45,188 @@ def test_association_and_multiplicity():
     field_nodes = [n for n in data["nodes"] if n["kind"] == "Field"]
     items_field = [f for f in field_nodes if f["attrs"]["name"] == "items"][0]
     assert items_field["attrs"]["multiplicity"] == "1..*"
+
+
+def test_calls_are_ordered_in_source_order():
+    code = """
+    class Repo {
+        void save() {}
+        static void log() {}
+    }
+
+    class Service {
+        private Repo repo;
+
+        void run() {
+            Repo.log();
+            if (true) {
+                repo.save();
+            }
+            helper();
+        }
+
+        void helper() {}
+    }
+    """
+    adapter = JavaAdapter()
+    graph = adapter.build_cir_graph_for_code(code)
+    data = graph.to_debug_json()
+
+    calls = sorted(
+        (e["attrs"]["order"], e["dst"])
+        for e in data["edges"]
+        if e["type"] == "CALLS" and e["src"] == "method:Service:run"
+    )
+    assert [dst for _, dst in calls] == [
+        "method:Repo:log",
+        "method:Repo:save",
+        "method:Service:helper",
+    ]
+    assert [order for order, _ in calls] == [0, 1, 2]
+
+
+def test_duplicate_short_names_resolve_to_same_package(tmp_path):
+    shop = tmp_path / "Shop.java"
+    shop.write_text(
+        "package com.shop;\n"
+        "class Item {}\n"
+        "class Cart { private Item item; }\n",
+        encoding="utf-8",
+    )
+    other = tmp_path / "Other.java"
+    other.write_text(
+        "package org.other;\n"
+        "class Item {}\n"
+        "class Basket { private Item item; }\n",
+        encoding="utf-8",
+    )
+
+    adapter = JavaAdapter()
+    graph = adapter.build_cir_graph_for_files([str(shop), str(other)])
+    edges = {(e["src"], e["dst"], e["type"]) for e in graph.to_debug_json()["edges"]}
+
+    assert ("type:com.shop.Cart", "type:com.shop.Item", "ASSOCIATES") in edges
+    assert ("type:org.other.Basket", "type:org.other.Item", "ASSOCIATES") in edges
+    assert ("type:com.shop.Cart", "type:org.other.Item", "ASSOCIATES") not in edges
+
+
+def test_unit_cache_replays_same_graph(tmp_path):
+    sources = {
+        "Item.java": "class Item { int id; }\n",
+        "Order.java": "class Order { private Item item; void add(Item i) { i.toString(); } }\n",
+        "Bad.java": "class Bad {",
+    }
+
+    def write_project(name):
+        root = tmp_path / name
+        root.mkdir()
+        for fname, code in sources.items():
+            (root / fname).write_text(code, encoding="utf-8")
+        return [str(root / fname) for fname in sources]
+
+    cache_path = str(tmp_path / "cir_cache.sqlite")
+    first = write_project("first")
+    cold = JavaAdapter(cache_path=cache_path).build_cir_graph_for_files(first)
+
+    # same contents under new paths (as /parse/project does per request)
+    second = write_project("second")
+    warm = JavaAdapter(cache_path=cache_path).build_cir_graph_for_files(second)
+
+    assert warm.to_debug_json() == cold.to_debug_json()
+    assert [e["file"] for e in warm.g.graph["parse_errors"]] == [second[2]]
+
+    # one more file: the project graph misses, the unchanged units still hit
+    (tmp_path / "second" / "Extra.java").write_text("class Extra { Order o; }\n", encoding="utf-8")
+    grown = second + [str(tmp_path / "second" / "Extra.java")]
+    cached = JavaAdapter(cache_path=cache_path).build_cir_graph_for_files(grown)
+    fresh = JavaAdapter().build_cir_graph_for_files(grown)
+
+    assert cached.to_debug_json() == fresh.to_debug_json()
+
+
+def test_unit_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    from adapters.java_adapter import _UnitPayloadCache
+
+    monkeypatch.setattr(_UnitPayloadCache, "_MAX_ROWS", {"cache": 2, "graphs": 1})
+    cache = _UnitPayloadCache(str(tmp_path / "cir_cache.sqlite"))
+
+    cache.put_many([("a", 1), ("b", 2)])
+    assert cache.get("a") == 1  # b is now the oldest
+    cache.put_many([("c", 3)])
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    cache.put_graph("g1", "first")
+    cache.put_graph("g2", "second")
+    assert (cache.get_graph("g1"), cache.get_graph("g2")) == (None, "second")
+
+
+POOL_SOURCES = {
+    "Base.java": "package p; public abstract class Base { protected int id; abstract void run(); }\n",
+    "Item.java": "package p; public class Item extends Base { String name; void run() { touch(); } void touch() {} }\n",
+    "Order.java": (
+        "package p; import java.util.List;\n"
+        "public class Order { private List<Item> items; private Item main;\n"
+        "  void add(Item i) { i.touch(); new Item().run(); } }\n"
+    ),
+    "Shop.java": "package p; interface Shop { Order place(Item i); }\n",
+    "Bad.java": "class Bad {",
+    "Cart.java": "package p; class Cart implements Shop { public Order place(Item i) { return new Order(); } }\n",
+}
+
+
+def write_pool_project(tmp_path):
+    for fname, code in POOL_SOURCES.items():
+        (tmp_path / fname).write_text(code, encoding="utf-8")
+    return [str(tmp_path / fname) for fname in POOL_SOURCES]
+
+
+def force_pool(monkeypatch):
+    import adapters.java_adapter as ja
+
+    # below the real threshold and regardless of the machine's core count
+    monkeypatch.setattr(ja, "PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(ja.os, "cpu_count", lambda: 2)
+    ja._clear_ast_cache()
+    return ja
+
+
+def test_pooled_build_matches_serial(tmp_path, monkeypatch):
+    files = write_pool_project(tmp_path)
+    serial = JavaAdapter().build_cir_graph_for_files(files)
+
+    ja = force_pool(monkeypatch)
+    try:
+        pooled = JavaAdapter().build_cir_graph_for_files(files)
+        assert ja._PARSE_POOL is not None
+    finally:
+        if ja._PARSE_POOL is not None:
+            ja._discard_parse_pool(ja._PARSE_POOL)
+
+    assert pooled.to_debug_json() == serial.to_debug_json()
+    assert pooled.g.graph["parse_errors"] == serial.g.graph["parse_errors"]
+
+
+def test_broken_pool_falls_back_to_in_process(tmp_path, monkeypatch):
+    from concurrent.futures.process import BrokenProcessPool
+
+    class DeadPool:
+        shut_down = False
+
+        def map(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    files = write_pool_project(tmp_path)
+    serial = JavaAdapter().build_cir_graph_for_files(files)
+
+    ja = force_pool(monkeypatch)
+    dead = DeadPool()
+    monkeypatch.setattr(ja, "_PARSE_POOL", dead)
+    recovered = JavaAdapter().build_cir_graph_for_files(files)
+
+    assert recovered.to_debug_json() == serial.to_debug_json()
+    assert recovered.g.graph["parse_errors"] == serial.g.graph["parse_errors"]
+    # the broken pool is dropped so the next build starts a fresh one
+    assert dead.shut_down and ja._PARSE_POOL is None
@@ -481,9 +481,14 @@ async function onStopPlugin(name?: string) {
 
     setBusy(true);
     try {
-      await axios.post(`${API}/core/docker/start-both`, { apps });
+      const { data } = await axios.post(`${API}/core/docker/start-both`, { apps });
       await dockerList();
-      alert("Started selected subdirs in Docker.");
+      const failed = Object.entries((data?.errors || {}) as Record<string, string>);
+      if (failed.length) {
+        alert(`Some subdirs failed to start:\n${failed.map(([k, v]) => `${k}: ${v}`).join("\n")}`);
+      } else {
+        alert("Started selected subdirs in Docker.");
+      }
     } catch (e: any) {
       alert(e?.response?.data?.detail ?? e.message ?? "Docker start failed");
     } finally {